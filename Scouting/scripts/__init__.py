@@ -46,6 +46,7 @@ from .stats import (
     WIESBADEN_OUTPUT_PATH,
     ERFURT_CANONICAL_NAME,
     ERFURT_OUTPUT_PATH,
+    FOCUS_TEAM_OVERVIEWS,
     LEAGUE_STATS_OUTPUT_PATH,
     SCHWERIN_CANONICAL_NAME,
     SCHWERIN_OUTPUT_PATH,
@@ -57,6 +58,7 @@ from .stats import (
     collect_team_player_stats,
     collect_usc_match_stats,
     collect_usc_player_stats,
+    prepare_overview_inputs,
     summarize_metrics,
 )
 from .statsvbl import (
@@ -114,6 +116,7 @@ __all__ = [
     "WIESBADEN_OUTPUT_PATH",
     "ERFURT_CANONICAL_NAME",
     "ERFURT_OUTPUT_PATH",
+    "FOCUS_TEAM_OVERVIEWS",
     "LEAGUE_STATS_OUTPUT_PATH",
     "SCHWERIN_CANONICAL_NAME",
     "SCHWERIN_OUTPUT_PATH",
@@ -125,6 +128,7 @@ __all__ = [
     "collect_team_player_stats",
     "collect_usc_match_stats",
     "collect_usc_player_stats",
+    "prepare_overview_inputs",
     "summarize_metrics",
     "DEFAULT_VBL_BASE_URL",
     "DEFAULT_VBL_OUTPUT_DIR",
@@ -1,17 +1,21 @@
 import argparse
-import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-from .combined_csv import export_combined_player_stats
+import orjson
+
 from .combined_player_report import (
     DEFAULT_HTML_OUTPUT_PATH as COMBINED_PLAYER_HTML_OUTPUT_PATH,
-    generate_combined_player_html,
 )
 from .report import (
     BERLIN_TZ,
     DEFAULT_SCHEDULE_URL,
+    MatchDetails,
     SCHEDULE_PAGE_URL,
+    USC_CANONICAL_NAME,
+    atomic_write_bytes,
     build_html_report,
     collect_match_stats_totals,
     download_schedule,
@@ -23,31 +27,75 @@ from .report2 import (
     CSV_DIRECTORY,
     HTML_OUTPUT_PATH as CSV_HTML_OUTPUT_PATH,
     JSON_OUTPUT_PATH as CSV_JSON_OUTPUT_PATH,
-    build_overview_payload as build_csv_overview_payload,
-    render_html as render_csv_html,
 )
 from .stats import (
-    AACHEN_CANONICAL_NAME,
-    AACHEN_OUTPUT_PATH,
-    DRESDEN_CANONICAL_NAME,
-    DRESDEN_OUTPUT_PATH,
-    ERFURT_CANONICAL_NAME,
-    ERFURT_OUTPUT_PATH,
-    HAMBURG_CANONICAL_NAME,
-    HAMBURG_OUTPUT_PATH,
+    FOCUS_TEAM_OVERVIEWS,
     LEAGUE_STATS_OUTPUT_PATH,
-    SCHWERIN_CANONICAL_NAME,
-    SCHWERIN_OUTPUT_PATH,
-    WIESBADEN_CANONICAL_NAME,
-    WIESBADEN_OUTPUT_PATH,
     STATS_OUTPUT_PATH,
     build_league_stats_overview,
     build_stats_overview,
+    prepare_overview_inputs,
 )
 
 DEFAULT_OUTPUT_PATH = Path("docs/index.html")
 
+MANIFEST_PAYLOAD = {
+    "name": "Scouting USC Münster",
+    "short_name": "USC Scouting",
+    "description": "Aggregierte Spielerinnen-Statistiken des USC Münster aus den offiziellen VBL-PDFs.",
+    "lang": "de",
+    "start_url": "./",
+    "scope": "./",
+    "display": "standalone",
+    "background_color": "#0f766e",
+    "theme_color": "#0f766e",
+    "icons": [
+        {"src": "favicon.png", "sizes": "192x192", "type": "image/png"},
+        {
+            "src": "favicon.png",
+            "sizes": "512x512",
+            "type": "image/png",
+            "purpose": "any maskable",
+        },
+    ],
+}
+_MANIFEST_BYTES = orjson.dumps(
+    MANIFEST_PAYLOAD, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+)
+
 
+def _write_bytes_if_changed(path: Path, data: bytes) -> bool:
+    try:
+        # A size mismatch already proves the content changed, so only files
+        # of the same length are read back for the comparison.
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    atomic_write_bytes(path, data)
+    return True
+
+
+def _write_html_report(
+    output_path: Path,
+    *,
+    generated_at: datetime,
+    league_payload: dict[str, object],
+    team_payloads: dict[str, dict[str, object]],
+) -> None:
+    html = build_html_report(
+        generated_at=generated_at,
+        league_scouting=league_payload,
+        **{f"{key}_scouting": payload for key, payload in team_payloads.items()},
+    )
+    atomic_write_bytes(output_path, html.encode("utf-8"))
+
+    manifest_path = output_path.parent / "manifest.webmanifest"
+    _write_bytes_if_changed(manifest_path, _MANIFEST_BYTES)
+
+
+# parse_args does not mutate the parser, so one instance can be shared.
+@functools.lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Generate the USC Münster scouting overview"
@@ -156,142 +204,103 @@ def main() -> int:
     if args.skip_schedule_download and schedule_path and schedule_path.exists():
         should_download = False
 
-    if should_download:
-        download_schedule(schedule_path, url=args.schedule_url)
+    # The schedule CSV and the schedule page are independent requests, so the
+    # metadata page is fetched in the background while the CSV downloads.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        metadata_future = executor.submit(
+            fetch_schedule_match_metadata, args.schedule_page_url
+        )
+        if should_download:
+            download_schedule(schedule_path, url=args.schedule_url)
 
-    matches = load_schedule_from_file(schedule_path)
-    metadata = fetch_schedule_match_metadata(args.schedule_page_url)
-    detail_cache: dict[str, dict[str, object]] = {}
+        matches = load_schedule_from_file(schedule_path)
+        metadata = metadata_future.result()
+    detail_cache: dict[str, MatchDetails] = {}
     enriched_matches = enrich_matches(matches, metadata, detail_cache)
 
     stats_lookup = collect_match_stats_totals(enriched_matches)
-
-    stats_payload = build_stats_overview(
-        matches=enriched_matches,
-        schedule_csv_url=args.schedule_url,
-        schedule_page_url=args.schedule_page_url,
-        schedule_path=args.schedule_path,
-        output_path=args.data_output,
-        stats_lookup=stats_lookup,
-    )
-
-    hamburg_stats_payload = build_stats_overview(
-        matches=enriched_matches,
-        schedule_csv_url=args.schedule_url,
-        schedule_page_url=args.schedule_page_url,
-        schedule_path=args.schedule_path,
-        output_path=HAMBURG_OUTPUT_PATH,
-        focus_team=HAMBURG_CANONICAL_NAME,
-        stats_lookup=stats_lookup,
-    )
-
-    aachen_stats_payload = build_stats_overview(
-        matches=enriched_matches,
-        schedule_csv_url=args.schedule_url,
-        schedule_page_url=args.schedule_page_url,
-        schedule_path=args.schedule_path,
-        output_path=AACHEN_OUTPUT_PATH,
-        focus_team=AACHEN_CANONICAL_NAME,
-        stats_lookup=stats_lookup,
-    )
-
-    schwerin_stats_payload = build_stats_overview(
-        matches=enriched_matches,
-        schedule_csv_url=args.schedule_url,
-        schedule_page_url=args.schedule_page_url,
-        schedule_path=args.schedule_path,
-        output_path=SCHWERIN_OUTPUT_PATH,
-        focus_team=SCHWERIN_CANONICAL_NAME,
-        stats_lookup=stats_lookup,
-    )
-
-    dresden_stats_payload = build_stats_overview(
-        matches=enriched_matches,
+    overview_matches, stats_lookup = prepare_overview_inputs(
+        enriched_matches,
         schedule_csv_url=args.schedule_url,
         schedule_page_url=args.schedule_page_url,
         schedule_path=args.schedule_path,
-        output_path=DRESDEN_OUTPUT_PATH,
-        focus_team=DRESDEN_CANONICAL_NAME,
         stats_lookup=stats_lookup,
     )
 
-    print(
-        "USC scouting overview updated:",
-        f"{stats_payload['match_count']} matches processed -> {args.data_output}",
-    )
-
-    print(
-        "Hamburg scouting overview updated:",
-        f"{hamburg_stats_payload['match_count']} matches processed -> {HAMBURG_OUTPUT_PATH}",
-    )
-
-    print(
-        "Aachen scouting overview updated:",
-        f"{aachen_stats_payload['match_count']} matches processed -> {AACHEN_OUTPUT_PATH}",
-    )
-
-    print(
-        "Schwerin scouting overview updated:",
-        f"{schwerin_stats_payload['match_count']} matches processed -> {SCHWERIN_OUTPUT_PATH}",
-    )
-
-    print(
-        "Dresden scouting overview updated:",
-        f"{dresden_stats_payload['match_count']} matches processed -> {DRESDEN_OUTPUT_PATH}",
-    )
-
-    wiesbaden_stats_payload = build_stats_overview(
-        matches=enriched_matches,
-        schedule_csv_url=args.schedule_url,
-        schedule_page_url=args.schedule_page_url,
-        schedule_path=args.schedule_path,
-        output_path=WIESBADEN_OUTPUT_PATH,
-        focus_team=WIESBADEN_CANONICAL_NAME,
-        stats_lookup=stats_lookup,
-    )
+    overview_kwargs = {
+        "matches": overview_matches,
+        "schedule_csv_url": args.schedule_url,
+        "schedule_page_url": args.schedule_page_url,
+        "schedule_path": args.schedule_path,
+        "stats_lookup": stats_lookup,
+    }
 
-    print(
-        "Wiesbaden scouting overview updated:",
-        f"{wiesbaden_stats_payload['match_count']} matches processed -> {WIESBADEN_OUTPUT_PATH}",
-    )
+    team_overviews = (
+        ("USC", "usc", USC_CANONICAL_NAME, args.data_output),
+        *FOCUS_TEAM_OVERVIEWS,
+    )
+
+    # The overviews only read the shared match data and write to separate
+    # files; most of their time is spent downloading rosters, so threads
+    # overlap that I/O without having to pickle the match data.
+    with ThreadPoolExecutor(max_workers=len(team_overviews) + 1) as executor:
+        team_futures = {
+            key: executor.submit(
+                build_stats_overview,
+                output_path=output_path,
+                focus_team=canonical_name,
+                **overview_kwargs,
+            )
+            for _, key, canonical_name, output_path in team_overviews
+        }
+        league_future = executor.submit(
+            build_league_stats_overview,
+            output_path=LEAGUE_STATS_OUTPUT_PATH,
+            **overview_kwargs,
+        )
 
-    erfurt_stats_payload = build_stats_overview(
-        matches=enriched_matches,
-        schedule_csv_url=args.schedule_url,
-        schedule_page_url=args.schedule_page_url,
-        schedule_path=args.schedule_path,
-        output_path=ERFURT_OUTPUT_PATH,
-        focus_team=ERFURT_CANONICAL_NAME,
-        stats_lookup=stats_lookup,
-    )
+        team_payloads = {key: future.result() for key, future in team_futures.items()}
+        league_payload = league_future.result()
 
-    print(
-        "Erfurt scouting overview updated:",
-        f"{erfurt_stats_payload['match_count']} matches processed -> {ERFURT_OUTPUT_PATH}",
-    )
-
-    league_payload = build_league_stats_overview(
-        matches=enriched_matches,
-        schedule_csv_url=args.schedule_url,
-        schedule_page_url=args.schedule_page_url,
-        schedule_path=args.schedule_path,
-        output_path=LEAGUE_STATS_OUTPUT_PATH,
-        stats_lookup=stats_lookup,
-    )
+    for label, key, _, output_path in team_overviews:
+        print(
+            f"{label} scouting overview updated:",
+            f"{team_payloads[key]['match_count']} matches processed -> {output_path}",
+        )
 
     print(
         "League scouting overview updated:",
         f"{league_payload['team_count']} teams processed -> {LEAGUE_STATS_OUTPUT_PATH}",
     )
 
+    # The main report only needs the overview payloads, so it is rendered and
+    # written in the background while the CSV reports are built.
+    html_executor = ThreadPoolExecutor(max_workers=1)
+    html_future = None
+    if not args.skip_html:
+        html_future = html_executor.submit(
+            _write_html_report,
+            args.output,
+            generated_at=datetime.now(tz=BERLIN_TZ),
+            league_payload=league_payload,
+            team_payloads=team_payloads,
+        )
+
     if not args.skip_csv_report:
-        csv_payload = build_csv_overview_payload(args.csv_data_dir)
+        from .combined_csv import export_combined_player_stats
+        from .report2 import (
+            build_overview_payload as build_csv_overview_payload,
+            scan_csv_directory,
+        )
+
+        # Both CSV consumers look at the same directory; list it only once.
+        csv_entries = scan_csv_directory(args.csv_data_dir)
+        csv_payload = build_csv_overview_payload(args.csv_data_dir, csv_entries)
 
         csv_json_output = args.csv_json_output
-        csv_json_output.parent.mkdir(parents=True, exist_ok=True)
-        csv_json_output.write_text(
-            json.dumps(csv_payload, ensure_ascii=False, indent=2) + "\n",
-            encoding="utf-8",
+        atomic_write_bytes(
+            csv_json_output,
+            orjson.dumps(csv_payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE),
         )
 
         try:
@@ -311,6 +320,7 @@ def main() -> int:
             csv_data_dir=args.csv_data_dir,
             output_path=combined_output,
             diff_output_path=args.combined_player_diff_output,
+            csv_entries=csv_entries,
         )
 
         try:
@@ -332,11 +342,15 @@ def main() -> int:
         print("PDF/CSV differences CSV generated:", diff_relative)
 
         if not args.skip_html:
+            from .combined_player_report import generate_combined_player_html
+            from .report2 import render_html as render_csv_html
+
             csv_html_output = args.csv_html_output
-            csv_html_output.parent.mkdir(parents=True, exist_ok=True)
-            csv_html_output.write_text(
-                render_csv_html(json_path=csv_json_output),
-                encoding="utf-8",
+            # The dashboard only embeds the JSON path and loads the data at
+            # runtime, so it rarely changes between runs.
+            _write_bytes_if_changed(
+                csv_html_output,
+                render_csv_html(json_path=csv_json_output).encode("utf-8"),
             )
 
             try:
@@ -363,49 +377,11 @@ def main() -> int:
     else:
         print("CSV scouting overview generation skipped via --skip-csv-report")
 
-    if args.skip_html:
+    html_executor.shutdown(wait=True)
+    if html_future is None:
         return 0
 
-    html = build_html_report(
-        generated_at=datetime.now(tz=BERLIN_TZ),
-        usc_scouting=stats_payload,
-        hamburg_scouting=hamburg_stats_payload,
-        aachen_scouting=aachen_stats_payload,
-        schwerin_scouting=schwerin_stats_payload,
-        dresden_scouting=dresden_stats_payload,
-        wiesbaden_scouting=wiesbaden_stats_payload,
-        erfurt_scouting=erfurt_stats_payload,
-        league_scouting=league_payload,
-    )
-    args.output.parent.mkdir(parents=True, exist_ok=True)
-    args.output.write_text(html, encoding="utf-8")
-
-    manifest_payload = {
-        "name": "Scouting USC Münster",
-        "short_name": "USC Scouting",
-        "description": "Aggregierte Spielerinnen-Statistiken des USC Münster aus den offiziellen VBL-PDFs.",
-        "lang": "de",
-        "start_url": "./",
-        "scope": "./",
-        "display": "standalone",
-        "background_color": "#0f766e",
-        "theme_color": "#0f766e",
-        "icons": [
-            {"src": "favicon.png", "sizes": "192x192", "type": "image/png"},
-            {
-                "src": "favicon.png",
-                "sizes": "512x512",
-                "type": "image/png",
-                "purpose": "any maskable",
-            },
-        ],
-    }
-    manifest_path = args.output.parent / "manifest.webmanifest"
-    manifest_path.write_text(
-        json.dumps(manifest_payload, ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
-    )
-
+    html_future.result()
     print("HTML report generated:", args.output)
 
     return 0
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import csv
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Callable, Dict, Iterable, Iterator, Mapping, MutableMapping, Optional, Sequence
 
 from zoneinfo import ZoneInfo
 
-from .report2 import canonicalize_player_name, canonicalize_team_name
+from .report2 import CsvEntries, canonicalize_player_name, canonicalize_team_name
 
 
 FIELD_ORDER = [
@@ -62,6 +66,8 @@ BERLIN_TZ = ZoneInfo("Europe/Berlin")
 
 CSV_TOTAL_MARKER = "totals"
 
+CSV_READ_WORKERS = 8
+
 
 DIFF_FIELD_ORDER = [
     "match_id",
@@ -84,6 +90,12 @@ DIFF_EXCLUDED_FIELDS = {
     "stats_url",
 }
 
+# The payloads are decoded JSON, i.e. plain dicts and lists. Listing the
+# concrete types first lets isinstance() match them without going through the
+# slower ABC subclass hooks; other mappings and sequences are still accepted.
+_MAPPING_TYPES = (dict, Mapping)
+_SEQUENCE_TYPES = (list, Sequence)
+
 
 def export_combined_player_stats(
     *,
@@ -92,6 +104,7 @@ def export_combined_player_stats(
     csv_data_dir: Path,
     output_path: Path,
     diff_output_path: Path | None = None,
+    csv_entries: CsvEntries | None = None,
 ) -> int:
     """Merge player level data from the PDF and CSV dashboards into one file."""
 
@@ -100,16 +113,20 @@ def export_combined_player_stats(
     for entry in _iter_pdf_player_rows(league_payload):
         _merge_row(rows, entry, source="pdf")
 
-    for entry in _iter_csv_player_rows(csv_payload, csv_data_dir):
+    available_csv_names = (
+        None if csv_entries is None else {path.name for path, _ in csv_entries}
+    )
+    for entry in _iter_csv_player_rows(csv_payload, csv_data_dir, available_csv_names):
         _merge_row(rows, entry, source="csv")
 
     ordered_rows = _serialise_rows(rows)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with output_path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=FIELD_ORDER)
-        writer.writeheader()
-        for row in ordered_rows:
-            writer.writerow(row)
+        writer = csv.writer(handle)
+        writer.writerow(FIELD_ORDER)
+        writer.writerows(
+            [row.get(field, "") for field in FIELD_ORDER] for row in ordered_rows
+        )
 
     if diff_output_path is not None:
         _write_source_differences(rows.values(), diff_output_path)
@@ -117,16 +134,21 @@ def export_combined_player_stats(
     return len(ordered_rows)
 
 
-@dataclass
+@dataclass(slots=True)
 class _RowState:
     values: Dict[str, object]
-    field_priorities: Dict[str, int]
     data_sources: set[str]
-    field_values_by_source: Dict[str, Dict[str, object]]
+    # Non-empty values per source; CSV values take precedence in ``values``.
+    pdf_values: Dict[str, object]
+    csv_values: Dict[str, object]
+
+    def source_values(self) -> tuple[tuple[str, Dict[str, object]], ...]:
+        return (("pdf", self.pdf_values), ("csv", self.csv_values))
 
 
-def _make_base_row() -> Dict[str, object]:
-    return {field: None for field in FIELD_ORDER if field != "data_sources"}
+_BASE_ROW_TEMPLATE: Dict[str, object] = {
+    field: None for field in FIELD_ORDER if field != "data_sources"
+}
 
 
 def _merge_row(
@@ -135,7 +157,6 @@ def _merge_row(
     *,
     source: str,
 ) -> None:
-    priority = SOURCE_PRIORITY[source]
     match_id = str(values.get("match_id") or "")
     match_number = str(values.get("match_number") or "")
     kickoff_value = str(values.get("kickoff") or "")
@@ -148,44 +169,57 @@ def _merge_row(
         match_id,
         match_number,
         kickoff_key,
-        (values.get("team") or "").lower(),
-        (values.get("player_name") or "").lower(),
+        _lowered_key_part(values.get("team") or ""),
+        _lowered_key_part(values.get("player_name") or ""),
     )
 
     if key not in rows:
-        base = _make_base_row()
+        base = _BASE_ROW_TEMPLATE.copy()
         base.update(values)
+        present = {field: value for field, value in values.items() if value is not None}
         rows[key] = _RowState(
             values=base,
-            field_priorities={
-                field: priority for field, value in values.items() if value is not None
-            },
             data_sources={source},
-            field_values_by_source={
-                field: {source: value}
-                for field, value in values.items()
-                if value is not None
-            },
+            pdf_values=present if source == "pdf" else {},
+            csv_values=present if source == "csv" else {},
         )
         return
 
     state = rows[key]
     state.data_sources.add(source)
-    for field, value in values.items():
-        if value is None:
-            continue
-        field_sources = state.field_values_by_source.setdefault(field, {})
-        field_sources[source] = value
-        current_priority = state.field_priorities.get(field, 0)
-        if state.values.get(field) is None or priority > current_priority:
-            state.values[field] = value
-            state.field_priorities[field] = priority
+    current_values = state.values
+    if source == "csv":
+        # CSV values replace PDF ones, but the first CSV value of a field wins.
+        csv_values = state.csv_values
+        for field, value in values.items():
+            if value is None:
+                continue
+            if field not in csv_values or current_values.get(field) is None:
+                current_values[field] = value
+            csv_values[field] = value
+    else:
+        pdf_values = state.pdf_values
+        for field, value in values.items():
+            if value is None:
+                continue
+            if current_values.get(field) is None:
+                current_values[field] = value
+            pdf_values[field] = value
+
+
+# Team and player names repeat across hundreds of rows; lowering them once and
+# interning the result keeps the row keys cheap to build and to hash.
+@lru_cache(maxsize=4096)
+def _lowered_key_part(value: str) -> str:
+    return sys.intern(value.lower())
 
 
 def _serialise_rows(
     rows: Mapping[tuple[str, str, str, str, str], _RowState]
 ) -> list[Dict[str, object]]:
-    ordered: list[Dict[str, object]] = []
+    # The sort key is built alongside each row, so sorting only compares the
+    # precomputed tuples.
+    decorated: list[tuple[tuple[object, ...], Dict[str, object]]] = []
     for state in rows.values():
         row = dict(state.values)
         row["data_sources"] = _format_data_sources(state)
@@ -194,39 +228,45 @@ def _serialise_rows(
         )
         row["host_comparison"] = _format_source_comparison(state, "host")
         row["opponent_comparison"] = _format_source_comparison(state, "opponent")
-        ordered.append(row)
-
-    ordered.sort(
-        key=lambda row: (
-            row.get("kickoff") or "",
-            row.get("match_number") or "",
-            row.get("team") or "",
-            row.get("player_name") or "",
+        sort_key = (
+            row["kickoff"] or "",
+            row["match_number"] or "",
+            row["team"] or "",
+            row["player_name"] or "",
         )
-    )
-    return ordered
+        decorated.append((sort_key, row))
+
+    decorated.sort(key=itemgetter(0))
+    return [row for _, row in decorated]
+
+
+# Precomputed labels for the source sets _merge_row can produce.
+_DATA_SOURCE_LABELS = {
+    frozenset({"csv"}): "csv",
+    frozenset({"pdf"}): "pdf",
+    frozenset({"csv", "pdf"}): "csv;pdf",
+}
 
 
 def _format_data_sources(state: _RowState) -> str:
-    sources = sorted(state.data_sources)
     if _sources_agree(state):
-        return ";".join([*sources, "match"])
-    return ";".join(sources)
+        return "csv;pdf;match"
+    label = _DATA_SOURCE_LABELS.get(frozenset(state.data_sources))
+    if label is None:
+        label = ";".join(sorted(state.data_sources))
+    return label
 
 
 def _sources_agree(state: _RowState) -> bool:
     if not {"csv", "pdf"}.issubset(state.data_sources):
         return False
 
-    agreement_found = False
-    for field_sources in state.field_values_by_source.values():
-        if "csv" not in field_sources or "pdf" not in field_sources:
-            continue
-        agreement_found = True
-        if field_sources["csv"] != field_sources["pdf"]:
-            return False
-
-    return agreement_found
+    pdf_values = state.pdf_values
+    csv_values = state.csv_values
+    shared_fields = pdf_values.keys() & csv_values.keys()
+    return bool(shared_fields) and all(
+        pdf_values[field] == csv_values[field] for field in shared_fields
+    )
 
 
 def _format_source_comparison(
@@ -235,13 +275,11 @@ def _format_source_comparison(
     *,
     value_formatter: Optional[Callable[[object], str]] = None,
 ) -> str:
-    values_by_source = state.field_values_by_source.get(field)
-    if not values_by_source:
-        value = state.values.get(field)
-        return _format_comparison_value(value, value_formatter)
-
     items: list[tuple[int, str, str]] = []
-    for source, raw_value in values_by_source.items():
+    for source, source_values in state.source_values():
+        if field not in source_values:
+            continue
+        raw_value = source_values[field]
         priority = SOURCE_PRIORITY.get(source, 99)
         label = SOURCE_LABELS.get(source, source.upper())
         formatted = _format_comparison_value(raw_value, value_formatter)
@@ -281,15 +319,24 @@ def _format_comparison_value(
 
 def _format_kickoff_date(value: object) -> str:
     if isinstance(value, datetime):
-        dt = value
-    else:
-        text = str(value).strip()
-        if not text:
-            return ""
-        try:
-            dt = datetime.fromisoformat(text)
-        except ValueError:
-            return text
+        return _format_kickoff_datetime(value)
+    return _format_kickoff_text(str(value))
+
+
+# Every player of a match shares its kickoff, so the formatted dates repeat.
+@lru_cache(maxsize=4096)
+def _format_kickoff_text(value: str) -> str:
+    text = value.strip()
+    if not text:
+        return ""
+    try:
+        dt = datetime.fromisoformat(text)
+    except ValueError:
+        return text
+    return _format_kickoff_datetime(dt)
+
+
+def _format_kickoff_datetime(dt: datetime) -> str:
     if dt.tzinfo is not None:
         dt = dt.astimezone(BERLIN_TZ)
     return dt.strftime("%d.%m.%Y")
@@ -300,207 +347,260 @@ DIFF_FIELD_FORMATTERS = {"kickoff": _format_kickoff_date}
 
 def _iter_pdf_player_rows(payload: Mapping[str, object]) -> Iterator[Dict[str, object]]:
     teams = payload.get("teams", [])
-    if not isinstance(teams, Sequence):
+    if not isinstance(teams, _SEQUENCE_TYPES):
         return
 
     for team_entry in teams:
-        if not isinstance(team_entry, Mapping):
+        if not isinstance(team_entry, _MAPPING_TYPES):
             continue
         team_name = canonicalize_team_name(team_entry.get("team", ""))
         match_lookup = _build_match_lookup(team_entry.get("matches", []))
+        # Every player of a match repeats the same match level fields, so the
+        # row template is built once per match and copied for each player.
+        match_templates: Dict[tuple, tuple[Dict[str, object], Mapping[str, object]]] = {}
 
         players = team_entry.get("players", [])
-        if not isinstance(players, Sequence):
+        if not isinstance(players, _SEQUENCE_TYPES):
             continue
         for player_entry in players:
-            if not isinstance(player_entry, Mapping):
+            if not isinstance(player_entry, _MAPPING_TYPES):
                 continue
             player_name = canonicalize_player_name(player_entry.get("name", ""))
             jersey_number = _parse_int(player_entry.get("jersey_number"))
 
             for match in player_entry.get("matches", []) or []:
-                if not isinstance(match, Mapping):
+                if not isinstance(match, _MAPPING_TYPES):
                     continue
-                match_number = _string_or_none(match.get("match_number"))
-                match_id = _string_or_none(match.get("match_id"))
-                kickoff = match.get("kickoff")
-                opponent = canonicalize_team_name(match.get("opponent", ""))
+                template_key = (
+                    match.get("match_number"),
+                    match.get("match_id"),
+                    match.get("kickoff"),
+                    match.get("opponent", ""),
+                    bool(match.get("is_home")),
+                    match.get("opponent_short"),
+                    match.get("stats_url"),
+                )
+                cached = match_templates.get(template_key)
+                if cached is None:
+                    cached = _build_pdf_match_template(match, match_lookup, team_name)
+                    match_templates[template_key] = cached
+                template, metadata = cached
+
                 metrics = match.get("metrics") or {}
-                totals = {
-                    "total_points": _parse_int(match.get("total_points")),
-                    "break_points": _parse_int(match.get("break_points")),
-                    "plus_minus": _parse_int(match.get("plus_minus")),
-                }
-
-                lookup_key = _match_key(match_id, match_number)
-                metadata = match_lookup.get(lookup_key, {})
-                if not isinstance(metadata, Mapping):
-                    metadata = {}
-
-                host_value = metadata.get("host")
-                if host_value:
-                    host_name = canonicalize_team_name(host_value)
-                elif match.get("is_home"):
-                    host_name = team_name
-                else:
-                    host_name = opponent if opponent else None
-
-                yield {
-                    "match_number": match_number,
-                    "match_id": match_id,
-                    "kickoff": kickoff,
-                    "is_home": bool(match.get("is_home")),
-                    "team": team_name,
-                    "opponent": opponent,
-                    "opponent_short": metadata.get("opponent_short")
-                    or match.get("opponent_short"),
-                    "host": host_name,
-                    "location": metadata.get("location"),
-                    "result_summary": _extract_result_summary(match, metadata),
-                    "player_name": player_name,
-                    "jersey_number": jersey_number,
-                    "serves_attempts": _parse_int(metrics.get("serves_attempts")),
-                    "serves_errors": _parse_int(metrics.get("serves_errors")),
-                    "serves_points": _parse_int(metrics.get("serves_points")),
-                    "receptions_attempts": _parse_int(
-                        metrics.get("receptions_attempts")
-                    ),
-                    "receptions_errors": _parse_int(
-                        metrics.get("receptions_errors")
-                    ),
-                    "receptions_positive": _parse_int(
-                        metrics.get("receptions_positive")
-                    ),
-                    "receptions_perfect": _parse_int(
-                        metrics.get("receptions_perfect")
-                    ),
-                    "receptions_positive_pct": _parse_percentage(
-                        metrics.get("receptions_positive_pct")
-                    ),
-                    "receptions_perfect_pct": _parse_percentage(
-                        metrics.get("receptions_perfect_pct")
-                    ),
-                    "attacks_attempts": _parse_int(metrics.get("attacks_attempts")),
-                    "attacks_errors": _parse_int(metrics.get("attacks_errors")),
-                    "attacks_blocked": _parse_int(metrics.get("attacks_blocked")),
-                    "attacks_points": _parse_int(metrics.get("attacks_points")),
-                    "attacks_success_pct": _parse_percentage(
-                        metrics.get("attacks_success_pct")
-                    ),
-                    "blocks_points": _parse_int(metrics.get("blocks_points")),
-                    "stats_url": metadata.get("stats_url") or match.get("stats_url"),
-                    "csv_path": None,
-                    **totals,
-                }
+                row = template.copy()
+                row["result_summary"] = _extract_result_summary(match, metadata)
+                row["player_name"] = player_name
+                row["jersey_number"] = jersey_number
+                for field, parser, native_type in _PDF_METRIC_PARSERS:
+                    value = metrics.get(field)
+                    row[field] = value if type(value) is native_type else parser(value)
+                for field in _PDF_TOTAL_FIELDS:
+                    value = match.get(field)
+                    row[field] = value if type(value) is int else _parse_int(value)
+                yield row
+
+
+def _build_pdf_match_template(
+    match: Mapping[str, object],
+    match_lookup: Mapping[_MatchLookupKey, Mapping[str, object]],
+    team_name: str,
+) -> tuple[Dict[str, object], Mapping[str, object]]:
+    match_number = _string_or_none(match.get("match_number"))
+    match_id = _string_or_none(match.get("match_id"))
+    opponent = canonicalize_team_name(match.get("opponent", ""))
+
+    metadata = _lookup_match(match_lookup, match_id, match_number)
+
+    host_value = metadata.get("host")
+    if host_value:
+        host_name = canonicalize_team_name(host_value)
+    elif match.get("is_home"):
+        host_name = team_name
+    else:
+        host_name = opponent if opponent else None
+
+    # The player fields keep their slots so rows have the same key order as
+    # before; they are filled in per player.
+    template: Dict[str, object] = {
+        "match_number": match_number,
+        "match_id": match_id,
+        "kickoff": match.get("kickoff"),
+        "is_home": bool(match.get("is_home")),
+        "team": team_name,
+        "opponent": opponent,
+        "opponent_short": metadata.get("opponent_short") or match.get("opponent_short"),
+        "host": host_name,
+        "location": metadata.get("location"),
+        "result_summary": None,
+        "player_name": None,
+        "jersey_number": None,
+    }
+    template.update(dict.fromkeys(field for field, _, _ in _PDF_METRIC_PARSERS))
+    template["stats_url"] = metadata.get("stats_url") or match.get("stats_url")
+    template["csv_path"] = None
+    template.update(dict.fromkeys(_PDF_TOTAL_FIELDS))
+    return template, metadata
 
 
 def _iter_csv_player_rows(
-    payload: Mapping[str, object], csv_data_dir: Path
+    payload: Mapping[str, object],
+    csv_data_dir: Path,
+    available_csv_names: set[str] | None = None,
 ) -> Iterator[Dict[str, object]]:
     teams = payload.get("teams", [])
-    if not isinstance(teams, Sequence):
+    if not isinstance(teams, _SEQUENCE_TYPES):
         return
 
+    tasks: list[tuple[Dict[str, object], str, Path]] = []
     for team_entry in teams:
-        if not isinstance(team_entry, Mapping):
+        if not isinstance(team_entry, _MAPPING_TYPES):
             continue
         team_name = canonicalize_team_name(team_entry.get("team", ""))
         matches = team_entry.get("matches", [])
-        if not isinstance(matches, Sequence):
+        if not isinstance(matches, _SEQUENCE_TYPES):
             continue
 
         for match in matches:
-            if not isinstance(match, Mapping):
+            if not isinstance(match, _MAPPING_TYPES):
                 continue
 
             match_number = _string_or_none(match.get("match_number"))
             match_id = _string_or_none(match.get("match_id"))
             kickoff = match.get("kickoff")
             opponent = canonicalize_team_name(match.get("opponent", ""))
-            host = canonicalize_team_name(match.get("host")) if match.get("host") else None
-            result_summary = _extract_result_summary(match, match)
             csv_path = match.get("csv_path")
             if not csv_path:
                 continue
 
-            csv_file = csv_data_dir / Path(csv_path).name
-            if not csv_file.exists():
+            csv_name = Path(csv_path).name
+            if available_csv_names is None:
+                if not (csv_data_dir / csv_name).exists():
+                    continue
+            elif csv_name not in available_csv_names:
                 continue
+            csv_file = csv_data_dir / csv_name
+
+            host_value = match.get("host")
+            if host_value:
+                host_name = canonicalize_team_name(host_value)
+            elif match.get("is_home"):
+                host_name = team_name
+            else:
+                host_name = opponent if opponent else None
+
+            match_fields = {
+                "match_number": match_number,
+                "match_id": match_id,
+                "kickoff": kickoff,
+                "is_home": bool(match.get("is_home")),
+                "team": team_name,
+                "opponent": opponent,
+                "opponent_short": match.get("opponent_short"),
+                "host": host_name,
+                "location": match.get("location"),
+                "result_summary": _extract_result_summary(match, match),
+            }
+            tasks.append((match_fields, str(csv_path), csv_file))
 
-            for row in _read_match_csv(csv_file):
-                raw_name = row.get("Name", "")
-                if not raw_name:
-                    continue
-                if raw_name.strip().lower() == CSV_TOTAL_MARKER:
-                    continue
-                player_name = canonicalize_player_name(raw_name)
+    if not tasks:
+        return
 
-                jersey_number = _parse_int(row.get("Number"))
-                receptions_attempts = _parse_int(row.get("Total Receptions"))
-                receptions_positive_pct = _parse_percentage(
-                    row.get("Positive Pass Percentage")
-                )
-                receptions_perfect_pct = _parse_percentage(
-                    row.get("Excellent/ Perfect Pass Percentage")
-                )
+    # The match CSVs are independent files; reading them on a few threads
+    # overlaps the file I/O while map() keeps the rows in match order.
+    workers = min(CSV_READ_WORKERS, len(tasks))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        parsed = executor.map(_read_csv_player_columns, [task[2] for task in tasks])
+        for (match_fields, csv_path_text, _), columns in zip(tasks, parsed):
+            for values in zip(*(columns[field] for field in _CSV_PLAYER_FIELDS)):
+                entry = dict(match_fields)
+                entry.update(zip(_CSV_PLAYER_FIELDS, values))
+                entry["stats_url"] = None
+                entry["csv_path"] = csv_path_text
+                yield entry
+
+
+# Player level fields of a CSV row, in the order they are emitted.
+_CSV_PLAYER_FIELDS = (
+    "player_name",
+    "jersey_number",
+    "total_points",
+    "break_points",
+    "plus_minus",
+    "serves_attempts",
+    "serves_errors",
+    "serves_points",
+    "receptions_attempts",
+    "receptions_errors",
+    "receptions_positive",
+    "receptions_perfect",
+    "receptions_positive_pct",
+    "receptions_perfect_pct",
+    "attacks_attempts",
+    "attacks_errors",
+    "attacks_blocked",
+    "attacks_points",
+    "attacks_success_pct",
+    "blocks_points",
+)
 
-                host_value = match.get("host")
-                if host_value:
-                    host_name = canonicalize_team_name(host_value)
-                elif match.get("is_home"):
-                    host_name = team_name
-                else:
-                    host_name = opponent if opponent else None
-
-                yield {
-                    "match_number": match_number,
-                    "match_id": match_id,
-                    "kickoff": kickoff,
-                    "is_home": bool(match.get("is_home")),
-                    "team": team_name,
-                    "opponent": opponent,
-                    "opponent_short": match.get("opponent_short"),
-                    "host": host_name,
-                    "location": match.get("location"),
-                    "result_summary": result_summary,
-                    "player_name": player_name,
-                    "jersey_number": jersey_number,
-                    "total_points": _parse_int(row.get("Total Points")),
-                    "break_points": _parse_int(row.get("Break Points")),
-                    "plus_minus": None,
-                    "serves_attempts": _parse_int(row.get("Total Serve")),
-                    "serves_errors": _parse_int(row.get("Serve Errors")),
-                    "serves_points": _parse_int(row.get("Ace")),
-                    "receptions_attempts": receptions_attempts,
-                    "receptions_errors": _parse_int(row.get("Reception Erros")),
-                    "receptions_positive": _estimate_attempts(
-                        receptions_attempts, receptions_positive_pct
-                    ),
-                    "receptions_perfect": _estimate_attempts(
-                        receptions_attempts, receptions_perfect_pct
-                    ),
-                    "receptions_positive_pct": receptions_positive_pct,
-                    "receptions_perfect_pct": receptions_perfect_pct,
-                    "attacks_attempts": _parse_int(row.get("Total Attacks")),
-                    "attacks_errors": _parse_int(row.get("Attack Erros")),
-                    "attacks_blocked": _parse_int(row.get("Blocked Attack")),
-                    "attacks_points": _parse_int(row.get("Attack Points (Exc.)")),
-                    "attacks_success_pct": _parse_percentage(
-                        row.get("Attack Points Percentage (Exc.%)")
-                    ),
-                    "blocks_points": _parse_int(row.get("Block Points")),
-                    "stats_url": None,
-                    "csv_path": str(csv_path),
-                }
-
-
-def _read_match_csv(path: Path) -> Iterable[Mapping[str, str]]:
-    with path.open(encoding="utf-8-sig", newline="") as handle:
-        reader = csv.DictReader(handle)
-        for row in reader:
-            if not row:
+
+def _read_csv_player_columns(path: Path) -> Dict[str, list]:
+    """Parse the player rows of a match CSV column by column."""
+
+    header_index, rows = _read_match_csv(path)
+    name_position = header_index.get("Name")
+    player_rows: list[list[str]] = []
+    player_names: list[str] = []
+    if name_position is not None:
+        for row in rows:
+            raw_name = row[name_position] if name_position < len(row) else ""
+            if not raw_name or raw_name.strip().lower() == CSV_TOTAL_MARKER:
                 continue
-            yield row
+            player_rows.append(row)
+            player_names.append(raw_name)
+
+    columns: Dict[str, list] = {
+        "player_name": [canonicalize_player_name(name) for name in player_names],
+        "plus_minus": [None] * len(player_rows),
+    }
+    for field, column, parser in _CSV_PLAYER_COLUMNS:
+        position = header_index.get(column)
+        if position is None:
+            cells: list[Optional[str]] = [None] * len(player_rows)
+        else:
+            cells = [
+                row[position] if position < len(row) else None for row in player_rows
+            ]
+        columns[field] = list(map(parser, cells))
+    columns["receptions_positive"] = list(
+        map(
+            _estimate_attempts,
+            columns["receptions_attempts"],
+            columns["receptions_positive_pct"],
+        )
+    )
+    columns["receptions_perfect"] = list(
+        map(
+            _estimate_attempts,
+            columns["receptions_attempts"],
+            columns["receptions_perfect_pct"],
+        )
+    )
+    return columns
+
+
+def _read_match_csv(path: Path) -> tuple[Dict[str, int], list[list[str]]]:
+    """Return the column positions and the non-empty data rows of a match CSV."""
+
+    with path.open(encoding="utf-8-sig", newline="") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return {}, []
+        # Later duplicates win, as they do for csv.DictReader.
+        header_index = {name: position for position, name in enumerate(header)}
+        rows = [row for row in reader if row]
+    return header_index, rows
 
 
 def _estimate_attempts(attempts: Optional[int], percentage: Optional[float]) -> Optional[int]:
@@ -509,6 +609,12 @@ def _estimate_attempts(attempts: Optional[int], percentage: Optional[float]) ->
     return int(round(attempts * percentage))
 
 
+_MISSING_NUMBER_TEXTS = frozenset({"", "-", ".", "na", "n/a"})
+_MISSING_PERCENTAGE_TEXTS = frozenset({"", "-", "."})
+_DECIMAL_COMMA_TABLE = str.maketrans({",": "."})
+_PERCENTAGE_TABLE = str.maketrans({",": ".", "%": None})
+
+
 def _parse_int(value: object) -> Optional[int]:
     if value is None:
         return None
@@ -520,11 +626,10 @@ def _parse_int(value: object) -> Optional[int]:
         except ValueError:
             return None
     text = str(value).strip()
-    if not text or text in {"-", ".", "na", "n/a"}:
+    if text in _MISSING_NUMBER_TEXTS:
         return None
-    text = text.replace(",", ".")
     try:
-        return int(float(text))
+        return int(float(text.translate(_DECIMAL_COMMA_TABLE)))
     except ValueError:
         return None
 
@@ -534,45 +639,117 @@ def _parse_percentage(value: object) -> Optional[float]:
         return None
     if isinstance(value, (int, float)):
         return float(value)
-    text = str(value).strip().replace("%", "")
-    if not text or text in {"-", "."}:
+    text = str(value).strip().translate(_PERCENTAGE_TABLE)
+    if text in _MISSING_PERCENTAGE_TEXTS:
         return None
-    text = text.replace(",", ".")
     try:
         return float(text) / 100.0
     except ValueError:
         return None
 
 
+# (output field, CSV column, parser) for the values read straight from a
+# match CSV.
+_CSV_PLAYER_COLUMNS: tuple[tuple[str, str, Callable[[object], object]], ...] = (
+    ("jersey_number", "Number", _parse_int),
+    ("total_points", "Total Points", _parse_int),
+    ("break_points", "Break Points", _parse_int),
+    ("serves_attempts", "Total Serve", _parse_int),
+    ("serves_errors", "Serve Errors", _parse_int),
+    ("serves_points", "Ace", _parse_int),
+    ("receptions_attempts", "Total Receptions", _parse_int),
+    ("receptions_errors", "Reception Erros", _parse_int),
+    ("receptions_positive_pct", "Positive Pass Percentage", _parse_percentage),
+    ("receptions_perfect_pct", "Excellent/ Perfect Pass Percentage", _parse_percentage),
+    ("attacks_attempts", "Total Attacks", _parse_int),
+    ("attacks_errors", "Attack Erros", _parse_int),
+    ("attacks_blocked", "Blocked Attack", _parse_int),
+    ("attacks_points", "Attack Points (Exc.)", _parse_int),
+    ("attacks_success_pct", "Attack Points Percentage (Exc.%)", _parse_percentage),
+    ("blocks_points", "Block Points", _parse_int),
+)
+
+
+# (output field, parser, native type) for the per-match metrics of a PDF
+# player entry. The payload mostly carries JSON numbers already; values of the
+# native type are taken as they are instead of going through the parser.
+_PDF_METRIC_PARSERS: tuple[tuple[str, Callable[[object], object], type], ...] = (
+    ("serves_attempts", _parse_int, int),
+    ("serves_errors", _parse_int, int),
+    ("serves_points", _parse_int, int),
+    ("receptions_attempts", _parse_int, int),
+    ("receptions_errors", _parse_int, int),
+    ("receptions_positive", _parse_int, int),
+    ("receptions_perfect", _parse_int, int),
+    ("receptions_positive_pct", _parse_percentage, float),
+    ("receptions_perfect_pct", _parse_percentage, float),
+    ("attacks_attempts", _parse_int, int),
+    ("attacks_errors", _parse_int, int),
+    ("attacks_blocked", _parse_int, int),
+    ("attacks_points", _parse_int, int),
+    ("attacks_success_pct", _parse_percentage, float),
+    ("blocks_points", _parse_int, int),
+)
+
+# Match totals stored directly on a PDF player's match entry.
+_PDF_TOTAL_FIELDS = ("total_points", "break_points", "plus_minus")
+
+
 def _extract_result_summary(
     primary: Mapping[str, object], fallback: Mapping[str, object]
 ) -> Optional[str]:
     for match in (primary, fallback):
         result = match.get("result")
-        if isinstance(result, Mapping):
+        if isinstance(result, _MAPPING_TYPES):
             summary = result.get("summary")
             if summary:
                 return str(summary)
     return None
 
 
-def _build_match_lookup(matches: object) -> Dict[str, Mapping[str, object]]:
-    lookup: Dict[str, Mapping[str, object]] = {}
-    if not isinstance(matches, Sequence):
+_MatchLookupKey = tuple[Optional[str], Optional[str]]
+
+
+def _build_match_lookup(matches: object) -> Dict[_MatchLookupKey, Mapping[str, object]]:
+    """Index matches by ``(match_id, match_number)``.
+
+    Each match is also reachable through ``(match_id, None)`` and
+    ``(None, match_number)`` unless another match owns that key exactly, so a
+    player entry that only carries one of the two identifiers still finds it.
+    """
+
+    lookup: Dict[_MatchLookupKey, Mapping[str, object]] = {}
+    if not isinstance(matches, _SEQUENCE_TYPES):
         return lookup
+    keyed: list[tuple[_MatchLookupKey, Mapping[str, object]]] = []
     for match in matches:
-        if not isinstance(match, Mapping):
+        if not isinstance(match, _MAPPING_TYPES):
             continue
-        key = _match_key(
+        key = (
             _string_or_none(match.get("match_id")),
             _string_or_none(match.get("match_number")),
         )
         lookup[key] = match
+        keyed.append((key, match))
+    for (match_id, match_number), match in keyed:
+        if match_id is not None:
+            lookup.setdefault((match_id, None), match)
+        if match_number is not None:
+            lookup.setdefault((None, match_number), match)
     return lookup
 
 
-def _match_key(match_id: Optional[str], match_number: Optional[str]) -> str:
-    return match_id or match_number or ""
+def _lookup_match(
+    lookup: Mapping[_MatchLookupKey, Mapping[str, object]],
+    match_id: Optional[str],
+    match_number: Optional[str],
+) -> Mapping[str, object]:
+    return (
+        lookup.get((match_id, match_number))
+        or lookup.get((match_id, None))
+        or lookup.get((None, match_number))
+        or {}
+    )
 
 
 def _string_or_none(value: object) -> Optional[str]:
@@ -599,8 +776,7 @@ def _write_source_differences(states: Iterable[_RowState], output_path: Path) ->
     with output_path.open("w", encoding="utf-8", newline="") as handle:
         writer = csv.DictWriter(handle, fieldnames=DIFF_FIELD_ORDER)
         writer.writeheader()
-        for row in difference_rows:
-            writer.writerow(row)
+        writer.writerows(difference_rows)
 
 
 def _iter_source_differences(states: Iterable[_RowState]) -> Iterator[Dict[str, str]]:
@@ -609,13 +785,14 @@ def _iter_source_differences(states: Iterable[_RowState]) -> Iterator[Dict[str,
             continue
 
         metadata = state.values
-        for field in state.field_values_by_source:
+        pdf_values = state.pdf_values
+        csv_values = state.csv_values
+        for field in dict.fromkeys([*pdf_values, *csv_values]):
             if field in DIFF_EXCLUDED_FIELDS:
                 continue
 
-            values_by_source = state.field_values_by_source.get(field, {})
-            pdf_value = values_by_source.get("pdf") if "pdf" in values_by_source else None
-            csv_value = values_by_source.get("csv") if "csv" in values_by_source else None
+            pdf_value = pdf_values.get(field)
+            csv_value = csv_values.get(field)
 
             if pdf_value == csv_value:
                 continue
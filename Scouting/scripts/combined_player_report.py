@@ -4,10 +4,14 @@ from __future__ import annotations
 
 import argparse
 import csv
+import io
+import re
+import sys
 from datetime import datetime
+from functools import lru_cache
 from html import escape
 from pathlib import Path
-from typing import Iterable, Mapping, Sequence
+from typing import Callable, Iterable, Iterator, Mapping, Optional, Sequence, TextIO
 
 from zoneinfo import ZoneInfo
 
@@ -18,6 +22,10 @@ DEFAULT_COMBINED_CSV_PATH = BASE_DIR / "docs" / "data" / "combined_player_stats.
 DEFAULT_HTML_OUTPUT_PATH = BASE_DIR / "docs" / "index3.html"
 BERLIN_TZ = ZoneInfo("Europe/Berlin")
 
+# Buffer for reading the combined CSV and writing the dashboard, larger than
+# the 8 KiB default.
+IO_BUFFER_SIZE = 1 << 20
+
 
 COLUMN_LABELS: Mapping[str, str] = {
     "data_sources": "Quellen",
@@ -59,19 +67,64 @@ VISIBLE_FIELDS: Sequence[str] = tuple(
 )
 
 
-def load_combined_player_rows(csv_path: Path) -> list[dict[str, str]]:
+def _open_combined_csv(csv_path: Path) -> TextIO:
     if not csv_path.exists():
         raise FileNotFoundError(f"Combined CSV not found: {csv_path}")
+    return csv_path.open("r", encoding="utf-8", newline="", buffering=IO_BUFFER_SIZE)
+
 
-    rows: list[dict[str, str]] = []
-    with csv_path.open("r", encoding="utf-8", newline="") as handle:
-        reader = csv.DictReader(handle)
+def iter_combined_player_rows(csv_path: Path) -> Iterator[dict[str, str]]:
+    with _open_combined_csv(csv_path) as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return
+        fieldnames = [sys.intern(name) for name in header]
+        field_count = len(fieldnames)
         for raw_row in reader:
-            row = {key: (value or "") for key, value in raw_row.items()}
-            rows.append(row)
-    return rows
+            if not raw_row:
+                continue
+            if len(raw_row) < field_count:
+                raw_row = raw_row + [""] * (field_count - len(raw_row))
+            yield dict(zip(fieldnames, raw_row))
+
+
+def load_combined_player_rows(csv_path: Path) -> list[dict[str, str]]:
+    return list(iter_combined_player_rows(csv_path))
+
 
+def _iter_visible_values(csv_path: Path) -> Iterator[list[str]]:
+    """Yield the ``VISIBLE_FIELDS`` values of each CSV row, in that order."""
 
+    with _open_combined_csv(csv_path) as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return
+        # Later duplicates win, as they do when a row is zipped into a dict.
+        header_index = {name: position for position, name in enumerate(header)}
+        positions = [header_index.get(field) for field in VISIBLE_FIELDS]
+        for raw_row in reader:
+            if not raw_row:
+                continue
+            row_length = len(raw_row)
+            yield [
+                raw_row[position] if position is not None and position < row_length else ""
+                for position in positions
+            ]
+
+
+def _count_combined_player_rows(csv_path: Path) -> int:
+    with _open_combined_csv(csv_path) as handle:
+        reader = csv.reader(handle)
+        if next(reader, None) is None:
+            return 0
+        return sum(1 for raw_row in reader if raw_row)
+
+
+# Booleans and percentages repeat across the rows as well, so their formatting
+# is cached like the kickoffs below.
+@lru_cache(maxsize=256)
 def _format_boolean(value: str) -> str:
     text = value.strip().lower()
     if text in {"true", "1", "yes", "ja"}:
@@ -81,6 +134,7 @@ def _format_boolean(value: str) -> str:
     return value
 
 
+@lru_cache(maxsize=4096)
 def _format_percentage(value: str) -> str:
     text = value.strip().replace("%", "")
     if not text:
@@ -94,6 +148,8 @@ def _format_percentage(value: str) -> str:
     return f"{number:.1f}%"
 
 
+# Kickoffs repeat for every player of a match, so the formatting is cached.
+@lru_cache(maxsize=4096)
 def _format_datetime(value: str) -> str:
     text = value.strip()
     if not text:
@@ -107,59 +163,139 @@ def _format_datetime(value: str) -> str:
     return dt.strftime("%d.%m.%Y %H:%M")
 
 
+def _format_data_sources(value: str) -> str:
+    return value.replace(";", ", ")
+
+
+CELL_FORMATTERS: Mapping[str, Callable[[str], str]] = {
+    "is_home": _format_boolean,
+    "kickoff": _format_datetime,
+    "data_sources": _format_data_sources,
+}
+
+
+def _cell_formatter(field: str) -> Optional[Callable[[str], str]]:
+    formatter = CELL_FORMATTERS.get(field)
+    if formatter is None and field.endswith("_pct"):
+        return _format_percentage
+    return formatter
+
+
+# Formatter of every visible column, resolved once at import.
+_VISIBLE_FORMATTERS: Mapping[str, Optional[Callable[[str], str]]] = {
+    field: _cell_formatter(field) for field in VISIBLE_FIELDS
+}
+
+_STATS_URL_INDEX: Optional[int] = (
+    VISIBLE_FIELDS.index("stats_url") if "stats_url" in VISIBLE_FIELDS else None
+)
+
+
 def format_cell(field: str, value: str) -> str:
     if not value:
         return ""
+    if field in _VISIBLE_FORMATTERS:
+        formatter = _VISIBLE_FORMATTERS[field]
+    else:
+        formatter = _cell_formatter(field)
+    return formatter(value) if formatter is not None else value
+
+
+# Most columns are low-cardinality (teams, hosts, counts), so escaped cell
+# values are cached.
+_escape_cell = lru_cache(maxsize=4096)(escape)
+
+# Numeric columns whose formatted values normally contain only digits, signs,
+# "." and "%". Their cells are left unescaped unless one of the row's values
+# in these columns contains a character escape() would rewrite.
+HTML_SAFE_FIELDS: frozenset[str] = frozenset(
+    {
+        "jersey_number",
+        "total_points",
+        "break_points",
+        "plus_minus",
+        "serves_attempts",
+        "serves_errors",
+        "serves_points",
+        "receptions_attempts",
+        "receptions_errors",
+        "receptions_positive",
+        "receptions_perfect",
+        "receptions_positive_pct",
+        "receptions_perfect_pct",
+        "attacks_attempts",
+        "attacks_errors",
+        "attacks_blocked",
+        "attacks_points",
+        "attacks_success_pct",
+        "blocks_points",
+    }
+)
 
-    if field == "is_home":
-        return _format_boolean(value)
-    if field == "kickoff":
-        return _format_datetime(value)
-    if field.endswith("_pct"):
-        return _format_percentage(value)
-    if field == "data_sources":
-        return value.replace(";", ", ")
-    if field == "stats_url":
-        return value
-    return value
+_SAFE_COLUMNS: tuple[bool, ...] = tuple(field in HTML_SAFE_FIELDS for field in VISIBLE_FIELDS)
+_SAFE_POSITIONS: tuple[int, ...] = tuple(
+    position for position, safe in enumerate(_SAFE_COLUMNS) if safe
+)
+_find_html_special = re.compile(r"[&<>\"']").search
 
 
-def render_table_rows(rows: Iterable[Mapping[str, str]]) -> str:
-    cells: list[str] = []
-    for row in rows:
-        row_cells: list[str] = []
-        for field in VISIBLE_FIELDS:
-            raw_value = row.get(field, "")
-            formatted = format_cell(field, raw_value)
-            if field == "stats_url" and formatted:
-                url = escape(raw_value, quote=True)
-                label = "PDF"
-                formatted_html = (
-                    f'<a href="{url}" target="_blank" rel="noopener">{escape(label)}</a>'
-                )
+def write_table_rows(handle: TextIO, rows: Iterable[Mapping[str, str]]) -> int:
+    """Write one ``<tr>`` per row to ``handle`` and return the number of rows."""
+
+    return _write_value_rows(
+        handle, ([row.get(field, "") for field in VISIBLE_FIELDS] for row in rows)
+    )
+
+
+def _write_value_rows(handle: TextIO, value_rows: Iterable[Sequence[str]]) -> int:
+    formatters = tuple(_VISIBLE_FORMATTERS.values())
+    link_index = _STATS_URL_INDEX
+    write = handle.write
+    row_count = 0
+    for values in value_rows:
+        formatted_values: list[str] = []
+        for raw_value, formatter in zip(values, formatters):
+            if not raw_value:
+                formatted_values.append("")
+            elif formatter is not None:
+                formatted_values.append(formatter(raw_value))
             else:
-                formatted_html = escape(formatted)
-            row_cells.append(f"<td>{formatted_html}</td>")
-        cells.append("<tr>" + "".join(row_cells) + "</tr>")
-    return "\n".join(cells)
+                formatted_values.append(raw_value)
+
+        safe_text = "".join([formatted_values[position] for position in _SAFE_POSITIONS])
+        if _find_html_special(safe_text) is None:
+            cells = [
+                value if safe else _escape_cell(value)
+                for value, safe in zip(formatted_values, _SAFE_COLUMNS)
+            ]
+        else:
+            cells = [_escape_cell(value) for value in formatted_values]
+        if link_index is not None and cells[link_index]:
+            cells[link_index] = (
+                f'<a href="{cells[link_index]}" target="_blank" rel="noopener">PDF</a>'
+            )
+
+        row_html = "<tr><td>" + "</td><td>".join(cells) + "</td></tr>"
+        write("\n" + row_html if row_count else row_html)
+        row_count += 1
+    return row_count
+
+
+def render_table_rows(rows: Iterable[Mapping[str, str]]) -> str:
+    buffer = io.StringIO()
+    write_table_rows(buffer, rows)
+    return buffer.getvalue()
 
 
 def render_combined_player_html(*, csv_path: Path) -> str:
-    rows = load_combined_player_rows(csv_path)
-    generated_at = datetime.now(tz=BERLIN_TZ)
-    row_count = len(rows)
-    table_rows = render_table_rows(rows)
-    header_cells = "".join(
-        f"<th>{escape(COLUMN_LABELS[field])}</th>" for field in VISIBLE_FIELDS
-    )
-    if csv_path.is_absolute():
-        try:
-            relative_path = csv_path.relative_to(BASE_DIR)
-        except ValueError:
-            relative_path = csv_path
-    else:
-        relative_path = csv_path
-    return f"""<!DOCTYPE html>
+    buffer = io.StringIO()
+    write_combined_player_html(buffer, csv_path=csv_path)
+    return buffer.getvalue()
+
+
+# The static parts of the page are plain strings, so the stylesheet is not
+# re-scanned as an f-string on every render.
+_HTML_HEAD = """<!DOCTYPE html>
 <html lang=\"de\">
 <head>
   <meta charset=\"utf-8\">
@@ -167,7 +303,7 @@ def render_combined_player_html(*, csv_path: Path) -> str:
   <title>Scouting Übersicht – Kombinierte Spielerinnen-Statistiken</title>
   <link rel=\"icon\" type=\"image/png\" sizes=\"32x32\" href=\"favicon.png\">
   <style>
-    :root {{
+    :root {
       color-scheme: light dark;
       --bg: #f5f7f9;
       --fg: #0f172a;
@@ -182,9 +318,9 @@ def render_combined_player_html(*, csv_path: Path) -> str:
       --table-row-bg: rgba(255, 255, 255, 0.96);
       --table-stripe: rgba(14, 116, 144, 0.08);
       --table-shadow: 0 20px 45px rgba(15, 23, 42, 0.18);
-    }}
-    @media (prefers-color-scheme: dark) {{
-      :root {{
+    }
+    @media (prefers-color-scheme: dark) {
+      :root {
         --bg: #0f1f24;
         --fg: #e2f1f4;
         --accent: #5eead4;
@@ -198,41 +334,41 @@ def render_combined_player_html(*, csv_path: Path) -> str:
         --table-row-bg: rgba(15, 38, 46, 0.92);
         --table-stripe: rgba(94, 234, 212, 0.16);
         --table-shadow: 0 20px 45px rgba(2, 14, 16, 0.6);
-      }}
-    }}
-    body {{
+      }
+    }
+    body {
       margin: 0;
       font-family: "Inter", "Segoe UI", -apple-system, BlinkMacSystemFont, "Helvetica Neue", Arial, sans-serif;
       background: var(--bg);
       color: var(--fg);
       line-height: 1.6;
-    }}
-    header {{
+    }
+    header {
       padding: clamp(1.8rem, 4vw, 2.6rem) clamp(1.2rem, 4vw, 2.8rem);
       display: grid;
       gap: 0.6rem;
       background: var(--card-bg);
       border-bottom: 1px solid var(--card-border);
       box-shadow: var(--shadow);
-    }}
-    header h1 {{
+    }
+    header h1 {
       margin: 0;
       font-size: clamp(2rem, 4vw, 2.6rem);
       letter-spacing: -0.01em;
-    }}
-    header p {{
+    }
+    header p {
       margin: 0;
       color: var(--muted);
       max-width: 50ch;
-    }}
-    main {{
+    }
+    main {
       max-width: 100rem;
       margin: 0 auto;
       padding: clamp(1.2rem, 3vw, 2.2rem) clamp(1rem, 4vw, 3rem);
       display: grid;
       gap: clamp(1.4rem, 3vw, 2.4rem);
-    }}
-    .meta {{
+    }
+    .meta {
       display: grid;
       gap: 0.8rem;
       grid-template-columns: repeat(auto-fit, minmax(16rem, 1fr));
@@ -241,16 +377,16 @@ def render_combined_player_html(*, csv_path: Path) -> str:
       border-radius: 1rem;
       padding: clamp(0.9rem, 3vw, 1.3rem);
       box-shadow: var(--shadow);
-    }}
-    .meta div {{
+    }
+    .meta div {
       display: grid;
       gap: 0.2rem;
-    }}
-    .meta span {{
+    }
+    .meta span {
       font-weight: 600;
       color: var(--accent);
-    }}
-    .table-wrapper {{
+    }
+    .table-wrapper {
       border-radius: 1rem;
       overflow-x: auto;
       overflow-y: hidden;
@@ -258,13 +394,13 @@ def render_combined_player_html(*, csv_path: Path) -> str:
       box-shadow: var(--table-shadow);
       -webkit-overflow-scrolling: touch;
       border: 1px solid var(--card-border);
-    }}
-    table {{
+    }
+    table {
       width: 100%;
       border-collapse: collapse;
       min-width: 1200px;
-    }}
-    thead th {{
+    }
+    thead th {
       text-align: left;
       padding: 0.85rem 1rem;
       font-size: 0.85rem;
@@ -277,34 +413,34 @@ def render_combined_player_html(*, csv_path: Path) -> str:
       top: 0;
       backdrop-filter: blur(6px);
       z-index: 1;
-    }}
-    tbody td {{
+    }
+    tbody td {
       padding: 0.8rem 1rem;
       border-top: 1px solid var(--card-border);
       font-size: 0.92rem;
       color: var(--fg);
       vertical-align: top;
       background: var(--table-row-bg);
-    }}
-    tbody tr:nth-child(even) td {{
+    }
+    tbody tr:nth-child(even) td {
       background: var(--table-stripe);
-    }}
-    a {{
+    }
+    a {
       color: var(--accent);
       font-weight: 600;
       text-decoration: none;
-    }}
-    a:hover, a:focus {{
+    }
+    a:hover, a:focus {
       text-decoration: underline;
-    }}
-    @media (max-width: 1024px) {{
-      header {{
+    }
+    @media (max-width: 1024px) {
+      header {
         border-radius: 0;
-      }}
-      table {{
+      }
+      table {
         min-width: 900px;
-      }}
-    }}
+      }
+    }
   </style>
 </head>
 <body>
@@ -312,7 +448,37 @@ def render_combined_player_html(*, csv_path: Path) -> str:
     <h1>Kombinierte Spielerinnen-Statistiken</h1>
     <p>Zusammenführung aus PDF- und CSV-Quellen. Jede Zeile entspricht einer Spielerin pro Spiel.</p>
   </header>
-  <main>
+"""
+
+_HTML_TAIL = """
+        </tbody>
+      </table>
+    </div>
+  </main>
+</body>
+</html>"""
+
+
+def write_combined_player_html(handle: TextIO, *, csv_path: Path) -> None:
+    """Stream the dashboard for ``csv_path`` into ``handle``."""
+
+    generated_at = datetime.now(tz=BERLIN_TZ)
+    # The row count is part of the page head. Counting the rows in a separate
+    # pass over the CSV is cheap and lets the rendered rows go straight to
+    # ``handle`` instead of being held in memory.
+    row_count = _count_combined_player_rows(csv_path)
+    header_cells = "".join(
+        f"<th>{escape(COLUMN_LABELS[field])}</th>" for field in VISIBLE_FIELDS
+    )
+    if csv_path.is_absolute():
+        try:
+            relative_path = csv_path.relative_to(BASE_DIR)
+        except ValueError:
+            relative_path = csv_path
+    else:
+        relative_path = csv_path
+    handle.write(_HTML_HEAD)
+    handle.write(f"""  <main>
     <section class=\"meta\">
       <div><span>Aktualisiert</span><div>{generated_at.strftime("%d.%m.%Y %H:%M:%S")} Uhr</div></div>
       <div><span>Einträge</span><div>{row_count}</div></div>
@@ -324,21 +490,17 @@ def render_combined_player_html(*, csv_path: Path) -> str:
           <tr>{header_cells}</tr>
         </thead>
         <tbody>
-{table_rows}
-        </tbody>
-      </table>
-    </div>
-  </main>
-</body>
-</html>"""
+""")
+    _write_value_rows(handle, _iter_visible_values(csv_path))
+    handle.write(_HTML_TAIL)
 
 
 def generate_combined_player_html(
     *, csv_path: Path = DEFAULT_COMBINED_CSV_PATH, output_path: Path = DEFAULT_HTML_OUTPUT_PATH
 ) -> Path:
-    html = render_combined_player_html(csv_path=csv_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(html, encoding="utf-8")
+    with output_path.open("w", encoding="utf-8", buffering=IO_BUFFER_SIZE) as handle:
+        write_combined_player_html(handle, csv_path=csv_path)
     return output_path
 
 
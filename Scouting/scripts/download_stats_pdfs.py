@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
+import orjson
 import requests
 from requests import HTTPError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DOWNLOAD_WORKERS = 8
 
 
 def _add_package_root_to_path() -> None:
@@ -73,6 +79,21 @@ def _ensure_relative(path: Path, base_dir: Path) -> str:
         return str(path)
 
 
+def _load_index(index_path: Path) -> Dict[str, str]:
+    try:
+        payload = orjson.loads(index_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    return {str(key): value for key, value in payload.items() if isinstance(value, str)}
+
+
+def _list_files(directory: Path) -> Set[str]:
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
+
 def main() -> int:
     _add_package_root_to_path()
     from scripts.report import (
@@ -97,54 +118,87 @@ def main() -> int:
         print("Keine Statistik-Links gefunden.")
         return 0
 
+    # One directory listing replaces a stat call per PDF; the previous index
+    # keeps entries for matches whose link is missing from this schedule run.
+    index_path = output_dir / "index.json"
+    previous_index = {} if args.overwrite else _load_index(index_path)
+    existing_files = _list_files(output_dir)
+
     downloaded = 0
     skipped = 0
     failed: List[str] = []
     missing: List[str] = []
     index_payload: Dict[str, str] = {}
 
-    for stats_url, match_numbers in sorted(
-        stats_lookup.items(), key=lambda item: (item[1][0], item[0])
-    ):
-        target_path = resolve_stats_pdf_cache_path(stats_url, cache_dir=output_dir)
-        existing = target_path.exists()
-        if existing and not args.overwrite:
-            skipped += 1
-        else:
-            try:
-                download_stats_pdf(
+    ordered_links = sorted(stats_lookup.items(), key=lambda item: (item[1][0], item[0]))
+    with requests.Session() as session, ThreadPoolExecutor(
+        max_workers=DOWNLOAD_WORKERS
+    ) as executor:
+        # urllib3 retries server errors with exponential backoff on the pooled
+        # connection, so each download is a single attempt on our side.
+        retry = Retry(
+            total=max(args.retries - 1, 0),
+            backoff_factor=args.delay_seconds,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=("GET",),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=DOWNLOAD_WORKERS,
+            pool_maxsize=DOWNLOAD_WORKERS * 2,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        # The downloads only wait on the network, so they run concurrently;
+        # the results are still reported in schedule order below.
+        jobs: List[Tuple[str, List[str], Path, Optional[Future[Path]]]] = []
+        for stats_url, match_numbers in ordered_links:
+            target_path = resolve_stats_pdf_cache_path(stats_url, cache_dir=output_dir)
+            if target_path.name in existing_files and not args.overwrite:
+                future = None
+            else:
+                future = executor.submit(
+                    download_stats_pdf,
                     stats_url,
                     output_path=target_path,
-                    retries=args.retries,
-                    delay_seconds=args.delay_seconds,
+                    retries=1,
+                    session=session,
                 )
-            except requests.RequestException as exc:  # pragma: no cover - Netzwerk
-                status_code = getattr(getattr(exc, "response", None), "status_code", None)
-                if isinstance(exc, HTTPError) and status_code == 404:
-                    missing.append(f"{match_numbers[0]}: {stats_url}")
-                    print(
-                        f"✖︎ Statistik nicht gefunden für Match {', '.join(match_numbers)}: {stats_url} (404)"
-                    )
-                else:
-                    failed.append(f"{match_numbers[0]}: {stats_url} -> {exc}")
-                continue
-            downloaded += 1
-            existing = True
-
-        if existing:
+            jobs.append((stats_url, match_numbers, target_path, future))
+
+        for stats_url, match_numbers, target_path, future in jobs:
+            if future is None:
+                skipped += 1
+            else:
+                try:
+                    future.result()
+                except requests.RequestException as exc:  # pragma: no cover - Netzwerk
+                    status_code = getattr(getattr(exc, "response", None), "status_code", None)
+                    if isinstance(exc, HTTPError) and status_code == 404:
+                        missing.append(f"{match_numbers[0]}: {stats_url}")
+                        print(
+                            f"✖︎ Statistik nicht gefunden für Match {', '.join(match_numbers)}: {stats_url} (404)"
+                        )
+                    else:
+                        failed.append(f"{match_numbers[0]}: {stats_url} -> {exc}")
+                    continue
+                downloaded += 1
+
             relative_name = _ensure_relative(target_path, output_dir)
             print(
                 f"✔︎ {relative_name} für Match {', '.join(match_numbers)} gespeichert"
             )
             for match_number in match_numbers:
                 index_payload[match_number] = relative_name
-        else:
-            print(f"⚠︎ Keine Datei für Match {', '.join(match_numbers)} gespeichert")
 
-    index_path = output_dir / "index.json"
-    index_path.write_text(
-        json.dumps(index_payload, ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
+    for match_number, relative_name in previous_index.items():
+        if match_number not in index_payload and relative_name in existing_files:
+            index_payload[match_number] = relative_name
+
+    index_path.write_bytes(
+        orjson.dumps(index_payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
     )
 
     summary_parts = [f"{downloaded} neue PDFs", f"{skipped} übersprungen"]
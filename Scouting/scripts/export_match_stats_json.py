@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
-from dataclasses import asdict
+from dataclasses import fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
+import orjson
+
 
 def _add_package_root_to_path() -> None:
     package_root = Path(__file__).resolve().parents[1]
@@ -47,8 +49,17 @@ def _default_output_path(stats_url: str) -> Path:
     return Path("docs/data/match_stats") / f"{slug}.json"
 
 
+@lru_cache(maxsize=None)
+def _metric_field_names(metrics_type: type) -> Tuple[str, ...]:
+    return tuple(field.name for field in fields(metrics_type))
+
+
 def _serialize_player(player) -> Dict[str, object]:
-    metrics_payload = asdict(player.metrics)
+    # The metrics only hold scalars, so a shallow copy matches asdict().
+    metrics = player.metrics
+    metrics_payload = {
+        name: getattr(metrics, name) for name in _metric_field_names(type(metrics))
+    }
     if player.break_points is not None:
         metrics_payload.setdefault("break_points", player.break_points)
     if player.plus_minus is not None:
@@ -153,9 +164,8 @@ def export_match_stats(stats_url: str, *, output_path: Optional[Path] = None) ->
 
     target_path = output_path or _default_output_path(stats_url)
     target_path.parent.mkdir(parents=True, exist_ok=True)
-    target_path.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
+    target_path.write_bytes(
+        orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
     )
     return payload
 
@@ -3,9 +3,12 @@ from __future__ import annotations
 
 import argparse
 import csv
-from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Iterable, List, Sequence, Tuple
+from typing import Dict, List, Mapping, Sequence, Tuple
 
 POSITIVE_PASS_CANDIDATES: Tuple[str, ...] = (
     "Positive Pass Percentage (Pos%)",
@@ -16,9 +19,15 @@ PERFECT_PASS_CANDIDATES: Tuple[str, ...] = (
     "Excellent/ Perfect Pass Percentage",
 )
 
+# Read and write buffer for the CSV files, larger than the 8 KiB default so a
+# file takes only a few system calls.
+CSV_BUFFER_SIZE = 1 << 20
 
-def parse_decimal(value: str) -> Decimal | None:
-    """Parse a numeric string into :class:`Decimal`.
+EXTEND_WORKERS = os.cpu_count() or 1
+
+
+def parse_number(value: str) -> float | None:
+    """Parse a numeric string into a :class:`float`.
 
     Empty strings, ``"-"`` and ``"."`` are treated as missing values and result in
     ``None``. Percent symbols are ignored. Numbers using a comma as decimal separator
@@ -30,25 +39,26 @@ def parse_decimal(value: str) -> Decimal | None:
 
     cleaned = cleaned.replace("%", "").replace(",", ".")
     try:
-        return Decimal(cleaned)
-    except InvalidOperation:
+        return float(cleaned)
+    except ValueError:
         return None
 
 
 def compute_pass_value(total_receptions: str, percentage: str) -> str:
     """Return the derived pass value rounded to the nearest integer.
 
-    Missing values are represented with ``"-"`` to match the raw CSV files.
+    Halves are rounded away from zero. Missing values are represented with
+    ``"-"`` to match the raw CSV files.
     """
-    receptions = parse_decimal(total_receptions)
-    percent = parse_decimal(percentage)
+    receptions = parse_number(total_receptions)
+    percent = parse_number(percentage)
 
     if receptions is None or percent is None:
         return "-"
 
-    value = (receptions * percent) / Decimal("100")
-    rounded = value.quantize(Decimal("1"), rounding=ROUND_HALF_UP)
-    return str(int(rounded))
+    value = receptions * percent / 100.0
+    rounded = math.floor(abs(value) + 0.5)
+    return str(-rounded if value < 0 else rounded)
 
 
 def extend_row(
@@ -57,72 +67,104 @@ def extend_row(
     positive_percentage_idx: int,
     perfect_percentage_idx: int,
 ) -> List[str]:
-    """Insert the derived pass values into ``row``."""
+    """Insert the derived pass values into ``row``.
+
+    ``row`` is modified in place and returned.
+    """
     insert_at = total_receptions_idx + 1
     positive_pass = compute_pass_value(row[total_receptions_idx], row[positive_percentage_idx])
     perfect_pass = compute_pass_value(row[total_receptions_idx], row[perfect_percentage_idx])
-    return row[:insert_at] + [positive_pass, perfect_pass] + row[insert_at:]
+    row[insert_at:insert_at] = (positive_pass, perfect_pass)
+    return row
+
+
+def build_header_index(header: Sequence[str]) -> Dict[str, int]:
+    """Map each column name to its first position in ``header``."""
+    header_index: Dict[str, int] = {}
+    for position, column in enumerate(header):
+        header_index.setdefault(column, position)
+    return header_index
 
 
 def resolve_column_index(
-    header: Sequence[str], candidates: Sequence[str], file_name: str
+    header_index: Mapping[str, int], candidates: Sequence[str], file_name: str
 ) -> int:
     for column in candidates:
-        if column in header:
-            return header.index(column)
+        position = header_index.get(column)
+        if position is not None:
+            return position
     raise ValueError(
         f"Missing any of the expected columns {candidates!r} in {file_name}"
     )
 
 
 def extend_csv(input_path: Path, output_path: Path) -> None:
-    """Create an extended CSV file with derived passing statistics."""
-    with input_path.open(newline="", encoding="utf-8") as input_file:
+    """Create an extended CSV file with derived passing statistics.
+
+    Rows are streamed from ``input_path`` to ``output_path`` one at a time.
+    """
+    with input_path.open(
+        newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE
+    ) as input_file:
         reader = csv.reader(input_file)
-        try:
-            header = next(reader)
-        except StopIteration:  # pragma: no cover - guard against empty files
-            header = []
-            rows: Iterable[List[str]] = []
-        else:
-            rows = list(reader)
-
-    extendable = bool(header) and "Total Receptions" in header
-    if extendable:
-        try:
-            total_receptions_idx = header.index("Total Receptions")
-            positive_idx = resolve_column_index(
-                header, POSITIVE_PASS_CANDIDATES, input_path.name
-            )
-            perfect_idx = resolve_column_index(
-                header, PERFECT_PASS_CANDIDATES, input_path.name
-            )
-        except ValueError:
-            extendable = False
-
-    if extendable:
-        insert_at = total_receptions_idx + 1
-        extended_header = header[:insert_at] + ["Positive Pass", "Perfect Pass"] + header[insert_at:]
-        extended_rows = [
-            extend_row(row, total_receptions_idx, positive_idx, perfect_idx)
-            for row in rows
-        ]
-    else:
-        extended_header = header
-        extended_rows = list(rows)
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", newline="", encoding="utf-8") as output_file:
-        writer = csv.writer(output_file)
-        if extended_header:
-            writer.writerow(extended_header)
-        writer.writerows(extended_rows)
+        header = next(reader, [])
+
+        header_index = build_header_index(header)
+        extendable = "Total Receptions" in header_index
+        if extendable:
+            try:
+                total_receptions_idx = header_index["Total Receptions"]
+                positive_idx = resolve_column_index(
+                    header_index, POSITIVE_PASS_CANDIDATES, input_path.name
+                )
+                perfect_idx = resolve_column_index(
+                    header_index, PERFECT_PASS_CANDIDATES, input_path.name
+                )
+            except ValueError:
+                extendable = False
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with output_path.open(
+            "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE
+        ) as output_file:
+            writer = csv.writer(output_file)
+            if extendable:
+                insert_at = total_receptions_idx + 1
+                writer.writerow(
+                    header[:insert_at] + ["Positive Pass", "Perfect Pass"] + header[insert_at:]
+                )
+                writer.writerows(
+                    extend_row(row, total_receptions_idx, positive_idx, perfect_idx)
+                    for row in reader
+                )
+            else:
+                if header:
+                    writer.writerow(header)
+                writer.writerows(reader)
+
+
+def _extend_into(csv_file: Path, output_dir: Path) -> None:
+    extend_csv(csv_file, output_dir / csv_file.name)
 
 
 def extend_directory(input_dir: Path, output_dir: Path) -> None:
     """Extend all CSV files in ``input_dir`` and write them to ``output_dir``."""
-    for csv_file in sorted(input_dir.glob("*.csv")):
-        extend_csv(csv_file, output_dir / csv_file.name)
+    csv_files = sorted(input_dir.glob("*.csv"))
+    workers = min(EXTEND_WORKERS, len(csv_files))
+    if workers <= 1:
+        for csv_file in csv_files:
+            _extend_into(csv_file, output_dir)
+        return
+
+    # The files are independent and converting them is CPU-bound, so they are
+    # spread over processes.
+    chunksize = max(1, len(csv_files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(
+            executor.map(
+                partial(_extend_into, output_dir=output_dir), csv_files, chunksize=chunksize
+            )
+        )
 
 
 def parse_args() -> argparse.Namespace:
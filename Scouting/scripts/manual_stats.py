@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
-import json
+import os
 import re
 import unicodedata
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Mapping, Optional, Sequence
 
+import orjson
+
 __all__ = [
     "DEFAULT_MANUAL_STATS_DIR",
     "DEFAULT_MANUAL_STATS_OVERVIEW_PATH",
+    "ManualAttackStats",
+    "ManualBlockStats",
     "ManualPlayerPayload",
+    "ManualReceptionStats",
+    "ManualServeStats",
     "ManualTeamStats",
     "ManualTeamFile",
     "build_manual_stats_overview",
@@ -22,15 +29,14 @@ __all__ = [
     "load_manual_team_files",
 ]
 
-DEFAULT_MANUAL_STATS_DIR = (
-    Path(__file__).resolve().parents[2] / "docs" / "data" / "manual_stats"
-)
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_MANUAL_STATS_DIR = _REPO_ROOT / "docs" / "data" / "manual_stats"
 DEFAULT_MANUAL_STATS_OVERVIEW_PATH = (
-    Path(__file__).resolve().parents[2] / "docs" / "data" / "manual_stats_overview.json"
+    _REPO_ROOT / "docs" / "data" / "manual_stats_overview.json"
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ManualPlayerPayload:
     """Raw manual statistics for a single player in a match."""
 
@@ -48,36 +54,90 @@ class ManualPlayerPayload:
             "total_points": self.total_points,
             "break_points": self.break_points,
             "plus_minus": self.plus_minus,
-            "metrics": dict(self.metrics),
+            # The loader builds a fresh dict per player; it is only read when
+            # serialised, so it is shared rather than copied again here.
+            "metrics": self.metrics if type(self.metrics) is dict else dict(self.metrics),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ManualServeStats:
+    attempts: int
+    errors: int
+    points: int
+
+    def to_dict(self) -> Dict[str, object]:
+        return {"attempts": self.attempts, "errors": self.errors, "points": self.points}
+
+
+@dataclass(frozen=True, slots=True)
+class ManualReceptionStats:
+    attempts: int
+    errors: int
+    positive_pct: str
+    perfect_pct: str
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "attempts": self.attempts,
+            "errors": self.errors,
+            "positive_pct": self.positive_pct,
+            "perfect_pct": self.perfect_pct,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class ManualAttackStats:
+    attempts: int
+    errors: int
+    blocked: int
+    points: int
+    success_pct: str
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "attempts": self.attempts,
+            "errors": self.errors,
+            "blocked": self.blocked,
+            "points": self.points,
+            "success_pct": self.success_pct,
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class ManualBlockStats:
+    points: int
+
+    def to_dict(self) -> Dict[str, object]:
+        return {"points": self.points}
+
+
+@dataclass(frozen=True, slots=True)
 class ManualTeamStats:
     """Manual statistics for one team in a match."""
 
     name: str
     aliases: Sequence[str]
     stats_url: str
-    serve: Mapping[str, object]
-    reception: Mapping[str, object]
-    attack: Mapping[str, object]
-    block: Mapping[str, object]
+    serve: ManualServeStats
+    reception: ManualReceptionStats
+    attack: ManualAttackStats
+    block: ManualBlockStats
     players: Sequence[ManualPlayerPayload]
 
     def to_dict(self) -> Dict[str, object]:
         return {
             "team": self.name,
             "stats_url": self.stats_url,
-            "serve": dict(self.serve),
-            "reception": dict(self.reception),
-            "attack": dict(self.attack),
-            "block": dict(self.block),
+            "serve": self.serve.to_dict(),
+            "reception": self.reception.to_dict(),
+            "attack": self.attack.to_dict(),
+            "block": self.block.to_dict(),
             "players": [player.to_dict() for player in self.players],
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ManualTeamFile:
     """Manual statistics for a team aggregated across matches."""
 
@@ -94,6 +154,15 @@ class ManualTeamFile:
         }
 
 
+# Player names, metric keys and percentage strings repeat in every match file,
+# so each distinct value is kept as a single shared string.
+_INTERNED_STRINGS: Dict[str, str] = {}
+
+
+def _intern(value: str) -> str:
+    return _INTERNED_STRINGS.setdefault(value, value)
+
+
 def _coerce_optional_int(value: object) -> Optional[int]:
     if value is None:
         return None
@@ -118,12 +187,15 @@ def _load_manual_players(entries: Sequence[Mapping[str, object]]) -> List[Manual
             metrics = {}
         players.append(
             ManualPlayerPayload(
-                name=name,
+                name=_intern(name),
                 jersey_number=_coerce_optional_int(entry.get("jersey_number")),
                 total_points=_coerce_optional_int(entry.get("total_points")),
                 break_points=_coerce_optional_int(entry.get("break_points")),
                 plus_minus=_coerce_optional_int(entry.get("plus_minus")),
-                metrics=dict(metrics),
+                metrics={
+                    _intern(key): _intern(value) if isinstance(value, str) else value
+                    for key, value in metrics.items()
+                },
             )
         )
     return players
@@ -155,7 +227,7 @@ def _normalize_aliases(values: Sequence[object]) -> List[str]:
         if not normalized or normalized in seen:
             continue
         seen.add(normalized)
-        aliases.append(alias)
+        aliases.append(_intern(alias))
     return aliases
 
 
@@ -165,18 +237,27 @@ def _normalize_percentage_string(value: object) -> Optional[str]:
     text = str(value).strip()
     if not text:
         return None
-    return text
+    return _intern(text)
 
 
-def _percentage_count(attempts: int, pct: Optional[str]) -> int:
-    if attempts <= 0 or not pct:
-        return 0
+# The same handful of "NN%" strings recur across matches, so parsing them is
+# cached.
+@lru_cache(maxsize=1024)
+def _parse_percentage_value(pct: str) -> Optional[float]:
     cleaned = pct.strip().replace("%", "").replace(",", ".")
     if not cleaned:
-        return 0
+        return None
     try:
-        value = float(cleaned)
+        return float(cleaned)
     except ValueError:
+        return None
+
+
+def _percentage_count(attempts: int, pct: Optional[str]) -> int:
+    if attempts <= 0 or not pct:
+        return 0
+    value = _parse_percentage_value(pct)
+    if value is None:
         return 0
     return int(round(attempts * (value / 100)))
 
@@ -187,16 +268,37 @@ def _format_percentage(numerator: int, denominator: int) -> Optional[str]:
     return f"{int(round((numerator / denominator) * 100))}%"
 
 
+# The files are decoded JSON, so plain dicts are checked before the Mapping ABC.
+_MAPPING_TYPES = (dict, Mapping)
+
+
+def _coerce_counts(
+    payload: Mapping[str, object], keys: Sequence[str]
+) -> Optional[tuple[int, ...]]:
+    """Return the ``keys`` of ``payload`` as ints, or ``None`` if one is missing."""
+
+    counts: List[int] = []
+    for key in keys:
+        value = payload.get(key)
+        if type(value) is not int:
+            value = _coerce_optional_int(value)
+            if value is None:
+                return None
+        counts.append(value)
+    return tuple(counts)
+
+
 def _load_manual_file(path: Path) -> Optional[ManualTeamFile]:
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError):
+        payload = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
         return None
     if not isinstance(payload, Mapping):
         return None
     team_name = str(payload.get("team") or "").strip()
     if not team_name:
         return None
+    team_name = _intern(team_name)
     raw_aliases = payload.get("aliases")
     if isinstance(raw_aliases, (str, bytes)):
         aliases = _normalize_aliases([raw_aliases])
@@ -209,7 +311,7 @@ def _load_manual_file(path: Path) -> Optional[ManualTeamFile]:
         return None
     matches: List[ManualTeamStats] = []
     for match_entry in matches_payload:
-        if not isinstance(match_entry, Mapping):
+        if not isinstance(match_entry, _MAPPING_TYPES):
             continue
         stats_url = str(match_entry.get("stats_url") or "").strip()
         if not stats_url:
@@ -218,60 +320,41 @@ def _load_manual_file(path: Path) -> Optional[ManualTeamFile]:
         reception_payload = match_entry.get("reception")
         attack_payload = match_entry.get("attack")
         block_payload = match_entry.get("block")
-        if not all(
-            isinstance(item, Mapping)
-            for item in (serve_payload, reception_payload, attack_payload, block_payload)
+        if not (
+            isinstance(serve_payload, _MAPPING_TYPES)
+            and isinstance(reception_payload, _MAPPING_TYPES)
+            and isinstance(attack_payload, _MAPPING_TYPES)
+            and isinstance(block_payload, _MAPPING_TYPES)
         ):
             continue
-        serve_attempts = _coerce_optional_int(serve_payload.get("attempts"))
-        serve_errors = _coerce_optional_int(serve_payload.get("errors"))
-        serve_points = _coerce_optional_int(serve_payload.get("points"))
-        reception_attempts = _coerce_optional_int(reception_payload.get("attempts"))
-        reception_errors = _coerce_optional_int(reception_payload.get("errors"))
-        attack_attempts = _coerce_optional_int(attack_payload.get("attempts"))
-        attack_errors = _coerce_optional_int(attack_payload.get("errors"))
-        attack_blocked = _coerce_optional_int(attack_payload.get("blocked"))
-        attack_points = _coerce_optional_int(attack_payload.get("points"))
-        block_points = _coerce_optional_int(block_payload.get("points"))
-        if None in {
-            serve_attempts,
-            serve_errors,
-            serve_points,
-            reception_attempts,
-            reception_errors,
-            attack_attempts,
-            attack_errors,
-            attack_blocked,
-            attack_points,
-            block_points,
-        }:
+        serve_counts = _coerce_counts(serve_payload, ("attempts", "errors", "points"))
+        if serve_counts is None:
+            continue
+        reception_counts = _coerce_counts(reception_payload, ("attempts", "errors"))
+        if reception_counts is None:
             continue
-        reception_positive_pct = _normalize_percentage_string(
-            reception_payload.get("positive_pct")
+        attack_counts = _coerce_counts(
+            attack_payload, ("attempts", "errors", "blocked", "points")
         )
-        reception_perfect_pct = _normalize_percentage_string(
-            reception_payload.get("perfect_pct")
+        if attack_counts is None:
+            continue
+        block_counts = _coerce_counts(block_payload, ("points",))
+        if block_counts is None:
+            continue
+        serve = ManualServeStats(*serve_counts)
+        reception = ManualReceptionStats(
+            *reception_counts,
+            positive_pct=_normalize_percentage_string(reception_payload.get("positive_pct"))
+            or "0%",
+            perfect_pct=_normalize_percentage_string(reception_payload.get("perfect_pct"))
+            or "0%",
         )
-        attack_success_pct = _normalize_percentage_string(attack_payload.get("success_pct"))
-        serve = {
-            "attempts": serve_attempts,
-            "errors": serve_errors,
-            "points": serve_points,
-        }
-        reception = {
-            "attempts": reception_attempts,
-            "errors": reception_errors,
-            "positive_pct": reception_positive_pct or "0%",
-            "perfect_pct": reception_perfect_pct or "0%",
-        }
-        attack = {
-            "attempts": attack_attempts,
-            "errors": attack_errors,
-            "blocked": attack_blocked,
-            "points": attack_points,
-            "success_pct": attack_success_pct or "0%",
-        }
-        block = {"points": block_points}
+        attack = ManualAttackStats(
+            *attack_counts,
+            success_pct=_normalize_percentage_string(attack_payload.get("success_pct"))
+            or "0%",
+        )
+        block = ManualBlockStats(*block_counts)
         players_payload = match_entry.get("players")
         if not isinstance(players_payload, Sequence):
             players_payload = []
@@ -297,17 +380,46 @@ def load_manual_team_files(directory: Optional[Path] = None) -> List[ManualTeamF
     if directory is None:
         directory = DEFAULT_MANUAL_STATS_DIR
     else:
-        directory = Path(directory)
+        directory = Path(directory).resolve()
 
-    if not directory.exists():
+    signature = _directory_signature(directory)
+    if not signature:
         return []
+    return list(_load_manual_team_files_cached(directory, signature))
+
+
+def _directory_signature(directory: Path) -> tuple[tuple[str, int, int], ...]:
+    """Name, mtime and size of every JSON file, so edits invalidate the cache."""
 
+    signature: List[tuple[str, int, int]] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                signature.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    except OSError:
+        return ()
+    signature.sort()
+    return tuple(signature)
+
+
+# The overview, the report and the team lookups all load the same directory in
+# one run; the files are only parsed again once the signature changes.
+@lru_cache(maxsize=4)
+def _load_manual_team_files_cached(
+    directory: Path, signature: tuple[tuple[str, int, int], ...]
+) -> tuple[ManualTeamFile, ...]:
     entries: List[ManualTeamFile] = []
-    for path in sorted(directory.glob("*.json")):
-        loaded = _load_manual_file(path)
+    for name, _mtime, _size in signature:
+        loaded = _load_manual_file(directory / name)
         if loaded is not None:
             entries.append(loaded)
-    return entries
+    return tuple(entries)
 
 
 def load_manual_stats_directory(
@@ -322,27 +434,51 @@ def load_manual_stats_directory(
     return grouped
 
 
-def _build_match_reception_payload(match: ManualTeamStats) -> Dict[str, object]:
-    reception = dict(match.reception)
-    attempts = int(reception.get("attempts", 0) or 0)
-    positive_pct = reception.get("positive_pct")
-    perfect_pct = reception.get("perfect_pct")
-    reception["positive"] = _percentage_count(attempts, positive_pct)
-    reception["perfect"] = _percentage_count(attempts, perfect_pct)
-    return reception
+def _build_match_reception_payload(
+    match: ManualTeamStats,
+) -> tuple[Dict[str, object], int, int]:
+    """Return the reception payload with its positive and perfect counts."""
+
+    reception = match.reception.to_dict()
+    attempts = match.reception.attempts
+    positive = _percentage_count(attempts, match.reception.positive_pct)
+    perfect = _percentage_count(attempts, match.reception.perfect_pct)
+    reception["positive"] = positive
+    reception["perfect"] = perfect
+    return reception, positive, perfect
 
 
-def _build_match_payload(match: ManualTeamStats) -> Dict[str, object]:
+def _build_match_payload(
+    match: ManualTeamStats, reception: Mapping[str, object]
+) -> Dict[str, object]:
     return {
         "stats_url": match.stats_url,
-        "serve": dict(match.serve),
-        "reception": _build_match_reception_payload(match),
-        "attack": dict(match.attack),
-        "block": dict(match.block),
+        "serve": match.serve.to_dict(),
+        "reception": reception,
+        "attack": match.attack.to_dict(),
+        "block": match.block.to_dict(),
         "players": [player.to_dict() for player in match.players],
     }
 
 
+def _match_counts(match: ManualTeamStats) -> tuple[int, ...]:
+    """Per-match counts summed into the team totals, in unpacking order."""
+
+    serve, reception, attack = match.serve, match.reception, match.attack
+    return (
+        serve.attempts,
+        serve.errors,
+        serve.points,
+        reception.attempts,
+        reception.errors,
+        attack.attempts,
+        attack.errors,
+        attack.blocked,
+        attack.points,
+        match.block.points,
+    )
+
+
 def build_manual_stats_overview(
     *,
     directory: Optional[Path] = None,
@@ -352,39 +488,32 @@ def build_manual_stats_overview(
 
     teams_payload: List[Dict[str, object]] = []
     for team_file in team_files:
-        serve_attempts_total = 0
-        serve_errors_total = 0
-        serve_points_total = 0
-        reception_attempts_total = 0
-        reception_errors_total = 0
-        reception_positive_total = 0
-        reception_perfect_total = 0
-        attack_attempts_total = 0
-        attack_errors_total = 0
-        attack_blocked_total = 0
-        attack_points_total = 0
-        block_points_total = 0
+        # One row of counts per match; the team totals are column sums.
+        match_counts: List[tuple[int, ...]] = []
         matches_payload: List[Dict[str, object]] = []
         for match in team_file.matches:
-            matches_payload.append(_build_match_payload(match))
-            serve_attempts_total += int(match.serve.get("attempts", 0) or 0)
-            serve_errors_total += int(match.serve.get("errors", 0) or 0)
-            serve_points_total += int(match.serve.get("points", 0) or 0)
-            reception_attempts = int(match.reception.get("attempts", 0) or 0)
-            reception_attempts_total += reception_attempts
-            reception_errors_total += int(match.reception.get("errors", 0) or 0)
-            reception_positive_total += _percentage_count(
-                reception_attempts, match.reception.get("positive_pct")
+            reception, reception_positive, reception_perfect = (
+                _build_match_reception_payload(match)
             )
-            reception_perfect_total += _percentage_count(
-                reception_attempts, match.reception.get("perfect_pct")
+            matches_payload.append(_build_match_payload(match, reception))
+            match_counts.append(
+                (*_match_counts(match), reception_positive, reception_perfect)
             )
-            attack_attempts = int(match.attack.get("attempts", 0) or 0)
-            attack_attempts_total += attack_attempts
-            attack_errors_total += int(match.attack.get("errors", 0) or 0)
-            attack_blocked_total += int(match.attack.get("blocked", 0) or 0)
-            attack_points_total += int(match.attack.get("points", 0) or 0)
-            block_points_total += int(match.block.get("points", 0) or 0)
+
+        (
+            serve_attempts_total,
+            serve_errors_total,
+            serve_points_total,
+            reception_attempts_total,
+            reception_errors_total,
+            attack_attempts_total,
+            attack_errors_total,
+            attack_blocked_total,
+            attack_points_total,
+            block_points_total,
+            reception_positive_total,
+            reception_perfect_total,
+        ) = [sum(column) for column in zip(*match_counts)] or [0] * 12
 
         totals_payload = {
             "serve": {
@@ -440,7 +569,7 @@ def build_manual_stats_overview(
         output_path = Path(output_path)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    output_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
 
     return payload
 
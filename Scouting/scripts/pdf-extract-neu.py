@@ -10,15 +10,27 @@ Bereinigt den Text:
 """
 
 from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import os
 import re
 import logging
+from typing import Iterator, List, Tuple
 from PyPDF2 import PdfReader
 
 
+EXTRACT_WORKERS = os.cpu_count() or 1
+
+
 # ------------------------------------------------------------
 # 🧹 Textbereinigung
 # ------------------------------------------------------------
+_DISALLOWED_CHARS = re.compile(r"[^A-Za-zÄÖÜäöüß0-9().% ]+")
+_SPACED_LETTERS = re.compile(r"(?<=\b[A-Za-zÄÖÜäöüß])\s(?=[A-Za-zÄÖÜäöüß]\b)")
+_MULTI_WHITESPACE = re.compile(r"\s{2,}")
+_LINE_BREAKS = re.compile(r"\s*\n\s*")
+
+
 def clean_text(raw_text: str) -> str:
     """
     Bereinigt Text aus PDF:
@@ -26,18 +38,18 @@ def clean_text(raw_text: str) -> str:
     - entfernt überflüssige Leerzeichen zwischen Buchstaben
     """
     # Nur erlaubte Zeichen
-    cleaned = re.sub(r"[^A-Za-zÄÖÜäöüß0-9().% ]+", " ", raw_text)
+    cleaned = _DISALLOWED_CHARS.sub(" ", raw_text)
 
     # PDFs mit einzeln gesetzten Buchstaben wie 'S p i e l' korrigieren
     # Ersetzt Leerzeichen zwischen einzelnen Buchstaben
     # Beispiel: 'S p i e l' -> 'Spiel'
-    cleaned = re.sub(r"(?:(?<=\b[A-Za-zÄÖÜäöüß])\s(?=[A-Za-zÄÖÜäöüß]\b))", "", cleaned)
+    cleaned = _SPACED_LETTERS.sub("", cleaned)
 
     # Doppelte Leerzeichen reduzieren
-    cleaned = re.sub(r"\s{2,}", " ", cleaned)
+    cleaned = _MULTI_WHITESPACE.sub(" ", cleaned)
 
     # Zeilenumbrüche vereinheitlichen
-    cleaned = re.sub(r"\s*\n\s*", "\n", cleaned)
+    cleaned = _LINE_BREAKS.sub("\n", cleaned)
 
     return cleaned.strip()
 
@@ -65,6 +77,22 @@ def extract_text_pypdf2(pdf_path: Path) -> str:
     return clean_text("\n".join(text_parts))
 
 
+def _extract_with_path(pdf_path: Path) -> Tuple[Path, str]:
+    return pdf_path, extract_text_pypdf2(pdf_path)
+
+
+def _iter_extracted_texts(pdf_files: List[Path]) -> Iterator[Tuple[Path, str]]:
+    """Liefert (PDF, Text) in Eingabereihenfolge, bei Bedarf parallel."""
+    workers = min(EXTRACT_WORKERS, len(pdf_files))
+    if workers <= 1:
+        yield from map(_extract_with_path, pdf_files)
+        return
+
+    chunksize = max(1, len(pdf_files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_extract_with_path, pdf_files, chunksize=chunksize)
+
+
 # ------------------------------------------------------------
 # 🚀 Hauptlogik
 # ------------------------------------------------------------
@@ -81,9 +109,8 @@ def main() -> None:
         print(f"⚠️ Keine PDFs gefunden in {pdf_dir.resolve()}")
         return
 
-    for pdf in pdf_files:
-        print(f"\n🔹 Verarbeite {pdf.name} …")
-        text = extract_text_pypdf2(pdf)
+    print(f"\n🔹 Verarbeite {len(pdf_files)} PDFs …")
+    for pdf, text in _iter_extracted_texts(pdf_files):
         out_file = output_dir / f"{pdf.stem}.txt"
         out_file.write_text(text, encoding="utf-8")
         print(f"✅ Gespeichert: {out_file.relative_to(root)}")
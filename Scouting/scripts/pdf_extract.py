@@ -2,18 +2,27 @@
 """
 Robuste PDF-Textextraktion für lokale und GitHub-Umgebung.
 - Nutzt pdfminer.six für PDFs mit echtem Text.
-- Fällt automatisch auf OCR (pytesseract + pdf2image) zurück.
+- Fällt automatisch auf OCR (pytesseract + pdf2image) zurück, bei gemischten
+  PDFs nur für die Seiten ohne Text.
 - Bricht nicht ab, falls OCR-Tools fehlen.
 """
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from io import StringIO
 from pathlib import Path
+from typing import List, Optional, Sequence
 import logging
+import os
 
 try:
-    from pdfminer.high_level import extract_text as pdfminer_extract
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
 except ImportError:
-    pdfminer_extract = None
+    PDFPage = None
 
 try:
     from pdf2image import convert_from_path
@@ -24,30 +33,90 @@ except ImportError:
 
 LOGGER = logging.getLogger(__name__)
 
+# tesseract läuft als eigener Prozess, Threads genügen also für parallele Seiten.
+OCR_WORKERS = os.cpu_count() or 1
+OCR_DPI = 200
+MIN_TEXT_LENGTH = 10
+
+
+def _has_text(text: str) -> bool:
+    return len(text.strip()) > MIN_TEXT_LENGTH
+
+
+def _extract_pdfminer_pages(pdf_path: Path) -> List[str]:
+    """Text je Seite; aneinandergehängt identisch mit pdfminers ``extract_text``."""
+    page_texts: List[str] = []
+    with open(pdf_path, "rb") as fp, StringIO() as output:
+        rsrcmgr = PDFResourceManager(caching=True)
+        device = TextConverter(rsrcmgr, output, laparams=LAParams())
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+        for page in PDFPage.get_pages(fp, caching=True):
+            interpreter.process_page(page)
+            page_texts.append(output.getvalue())
+            output.seek(0)
+            output.truncate()
+    return page_texts
+
+
+def _render_pages(pdf_path: Path, page_numbers: Optional[Sequence[int]] = None) -> list:
+    options = {"dpi": OCR_DPI, "grayscale": True, "thread_count": OCR_WORKERS}
+    if page_numbers is None:
+        return convert_from_path(pdf_path, **options)
+    images = []
+    for number in page_numbers:
+        images.extend(
+            convert_from_path(pdf_path, first_page=number, last_page=number, **options)
+        )
+    return images
+
+
+def _ocr_images(images: list, lang: str) -> List[str]:
+    ocr_page = partial(pytesseract.image_to_string, lang=lang)
+    workers = min(OCR_WORKERS, len(images))
+    if workers <= 1:
+        return [ocr_page(image) for image in images]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(ocr_page, images))
+
 
 def extract_text_auto(pdf_path: str | Path, lang: str = "deu") -> str:
     pdf_path = Path(pdf_path)
-    text = ""
+    page_texts: List[str] = []
 
-    # Versuch 1: pdfminer
-    if pdfminer_extract:
+    # Versuch 1: pdfminer, Seite für Seite
+    if PDFPage is not None:
         try:
-            text = pdfminer_extract(pdf_path)
-            if text and len(text.strip()) > 10:
-                LOGGER.info(f"✅ Text direkt extrahiert: {pdf_path.name}")
-                return text
+            page_texts = _extract_pdfminer_pages(pdf_path)
         except Exception as e:
             LOGGER.warning(f"⚠️ pdfminer fehlgeschlagen ({pdf_path.name}): {e}")
+            page_texts = []
 
-    # Versuch 2: OCR
+    missing = [index for index, text in enumerate(page_texts) if not _has_text(text)]
+    if page_texts and not missing:
+        LOGGER.info(f"✅ Text direkt extrahiert: {pdf_path.name}")
+        return "".join(page_texts)
+
+    # Versuch 2: OCR, nur für Seiten ohne Text
     if convert_from_path and pytesseract:
         try:
-            LOGGER.info(f"📄 OCR-Fallback für {pdf_path.name}")
-            pages = convert_from_path(pdf_path, dpi=200)
-            text_parts = [pytesseract.image_to_string(p, lang=lang) for p in pages]
-            return "\n\n".join(text_parts)
+            if not page_texts or len(missing) == len(page_texts):
+                LOGGER.info(f"📄 OCR-Fallback für {pdf_path.name}")
+                return "\n\n".join(_ocr_images(_render_pages(pdf_path), lang))
+
+            LOGGER.info(
+                f"📄 OCR-Fallback für {len(missing)} Seite(n) von {pdf_path.name}"
+            )
+            images = _render_pages(pdf_path, [index + 1 for index in missing])
+            for index, text in zip(missing, _ocr_images(images, lang)):
+                page_texts[index] = text + "\f"
+            return "".join(page_texts)
         except Exception as e:
             LOGGER.warning(f"⚠️ OCR fehlgeschlagen ({pdf_path.name}): {e}")
 
+    text = "".join(page_texts)
+    if _has_text(text):
+        LOGGER.info(f"✅ Text direkt extrahiert: {pdf_path.name}")
+        return text
+
     LOGGER.error(f"❌ Keine Textextraktion möglich für {pdf_path.name}")
     return ""
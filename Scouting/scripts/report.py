@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import base64
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import csv
 import json
+import os
+import threading
 import time
 from dataclasses import dataclass, replace
+from functools import lru_cache
 import hashlib
 import re
 from datetime import date, datetime, timedelta
@@ -107,21 +111,43 @@ def resolve_stats_pdf_cache_path(
     return base_dir / sanitized
 
 
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` without exposing a partially written file."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per process and thread so concurrent writers never share a
+    # temporary file; opened normally so the umask applies as usual.
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with tmp_path.open("wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
 def download_stats_pdf(
     stats_url: str,
     *,
     output_path: Optional[Path] = None,
     retries: int = 3,
     delay_seconds: float = 2.0,
+    session: Optional[requests.Session] = None,
 ) -> Path:
     target_path = output_path or resolve_stats_pdf_cache_path(stats_url)
     response = _http_get(
         stats_url,
         retries=retries,
         delay_seconds=delay_seconds,
+        session=session,
     )
-    target_path.parent.mkdir(parents=True, exist_ok=True)
-    target_path.write_bytes(response.content)
+    atomic_write_bytes(target_path, response.content)
     return target_path
 
 
@@ -178,6 +204,8 @@ REQUEST_HEADERS = {
 HTML_ACCEPT_HEADER = {"Accept": "text/html,application/xhtml+xml"}
 RSS_ACCEPT_HEADER = {"Accept": "application/rss+xml,text/xml"}
 NEWS_LOOKBACK_DAYS = 14
+MATCH_DETAIL_WORKERS = 8
+STATS_TOTALS_WORKERS = os.cpu_count() or 1
 INSTAGRAM_SEARCH_URL = "https://duckduckgo.com/html/"
 
 GERMAN_STOPWORDS = {
@@ -267,6 +295,16 @@ class MVPSelection:
     team: Optional[str] = None
 
 
+@dataclass(frozen=True, slots=True)
+class MatchDetails:
+    referees: Tuple[str, ...] = ()
+    attendance: Optional[str] = None
+    mvps: Tuple[MVPSelection, ...] = ()
+
+
+_EMPTY_MATCH_DETAILS = MatchDetails()
+
+
 @dataclass(frozen=True)
 class Match:
     kickoff: datetime
@@ -620,14 +658,16 @@ def _http_get(
     params: Optional[Dict[str, str]] = None,
     retries: int = 5,
     delay_seconds: float = 2.0,
+    session: Optional[requests.Session] = None,
 ) -> requests.Response:
     last_error: Optional[Exception] = None
     merged_headers = dict(REQUEST_HEADERS)
     if headers:
         merged_headers.update(headers)
+    get = session.get if session is not None else requests.get
     for attempt in range(retries):
         try:
-            response = requests.get(
+            response = get(
                 url,
                 timeout=30,
                 headers=merged_headers,
@@ -1035,7 +1075,7 @@ def fetch_match_details(
     *,
     retries: int = 5,
     delay_seconds: float = 2.0,
-) -> Dict[str, object]:
+) -> MatchDetails:
     url = build_match_details_url(match_id)
     response = _http_get(
         url,
@@ -1065,22 +1105,38 @@ def fetch_match_details(
 
     mvps = _parse_match_mvps(soup)
 
-    return {
-        "referees": tuple(referees),
-        "attendance": attendance,
-        "mvps": mvps,
-    }
+    return MatchDetails(
+        referees=tuple(referees),
+        attendance=attendance,
+        mvps=mvps,
+    )
+
+
+def _fetch_match_details_or_empty(match_id: str) -> MatchDetails:
+    try:
+        return fetch_match_details(match_id)
+    except requests.RequestException:
+        return _EMPTY_MATCH_DETAILS
+
+
+def _resolve_match_id(
+    match: Match, metadata: Dict[str, Dict[str, Optional[str]]]
+) -> Optional[str]:
+    if match.match_id:
+        return match.match_id
+    meta = metadata.get(match.match_number) if match.match_number else None
+    return meta.get("match_id") if meta else None
 
 
 def enrich_match(
     match: Match,
     metadata: Dict[str, Dict[str, Optional[str]]],
-    detail_cache: Dict[str, Dict[str, object]],
+    detail_cache: Dict[str, MatchDetails],
 ) -> Match:
     match_number = match.match_number
     meta = metadata.get(match_number) if match_number else None
 
-    match_id = match.match_id or (meta.get("match_id") if meta else None)
+    match_id = _resolve_match_id(match, metadata)
     info_url = match.info_url or (meta.get("info_url") if meta else None)
     stats_url = match.stats_url or (meta.get("stats_url") if meta else None)
     scoresheet_url = match.scoresheet_url or (meta.get("scoresheet_url") if meta else None)
@@ -1092,36 +1148,14 @@ def enrich_match(
     if match_id:
         detail = detail_cache.get(match_id)
         if detail is None:
-            try:
-                detail = fetch_match_details(match_id)
-            except requests.RequestException:
-                detail = {}
+            detail = _fetch_match_details_or_empty(match_id)
             detail_cache[match_id] = detail
-        fetched_referees = detail.get("referees") or ()
-        if fetched_referees:
-            referees = tuple(fetched_referees)
-        fetched_attendance = detail.get("attendance")
-        if fetched_attendance:
-            attendance = fetched_attendance
-        fetched_mvps = detail.get("mvps") or ()
-        if fetched_mvps:
-            normalized: List[MVPSelection] = []
-            for entry in fetched_mvps:
-                if isinstance(entry, MVPSelection):
-                    normalized.append(entry)
-                elif isinstance(entry, (tuple, list)) and len(entry) >= 2:
-                    medal = entry[0] if entry[0] is not None else None
-                    name = str(entry[1])
-                    team = entry[2] if len(entry) > 2 else None
-                    normalized.append(
-                        MVPSelection(
-                            medal=str(medal) if medal not in {None, ""} else None,
-                            name=name,
-                            team=str(team) if team not in {None, ""} else None,
-                        )
-                    )
-            if normalized:
-                mvps = tuple(normalized)
+        if detail.referees:
+            referees = detail.referees
+        if detail.attendance:
+            attendance = detail.attendance
+        if detail.mvps:
+            mvps = detail.mvps
 
     return replace(
         match,
@@ -1139,9 +1173,24 @@ def enrich_match(
 def enrich_matches(
     matches: Sequence[Match],
     metadata: Dict[str, Dict[str, Optional[str]]],
-    detail_cache: Optional[Dict[str, Dict[str, object]]] = None,
+    detail_cache: Optional[Dict[str, MatchDetails]] = None,
 ) -> List[Match]:
     cache = detail_cache if detail_cache is not None else {}
+    missing_ids = list(
+        dict.fromkeys(
+            match_id
+            for match_id in (_resolve_match_id(match, metadata) for match in matches)
+            if match_id and match_id not in cache
+        )
+    )
+    if missing_ids:
+        # Each detail page is a separate round trip; fetching them
+        # concurrently keeps several requests in flight instead of one.
+        workers = min(MATCH_DETAIL_WORKERS, len(missing_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            details = executor.map(_fetch_match_details_or_empty, missing_ids)
+            for match_id, detail in zip(missing_ids, details):
+                cache[match_id] = detail
     return [enrich_match(match, metadata, cache) for match in matches]
 
 
@@ -1237,10 +1286,9 @@ def collect_team_roster(
     if not url:
         return []
     csv_text = _download_roster_text(url, retries=retries, delay_seconds=delay_seconds)
-    directory.mkdir(parents=True, exist_ok=True)
     slug = slugify_team_name(team_name) or "team"
     destination = directory / f"{slug}.csv"
-    destination.write_text(csv_text, encoding="utf-8")
+    atomic_write_bytes(destination, csv_text.encode("utf-8"))
     return parse_roster(csv_text)
 
 
@@ -1472,49 +1520,30 @@ def _load_manual_stats_totals() -> Dict[
             name = team_entry.name
             if not name:
                 continue
-            serve = team_entry.serve or {}
-            reception = team_entry.reception or {}
-            attack = team_entry.attack or {}
-            block = team_entry.block or {}
-            try:
-                serve_attempts = int(serve["attempts"])
-                serve_errors = int(serve["errors"])
-                serve_points = int(serve["points"])
-                reception_attempts = int(reception["attempts"])
-                reception_errors = int(reception["errors"])
-                reception_positive_pct = str(reception["positive_pct"])
-                reception_perfect_pct = str(reception["perfect_pct"])
-                reception_positive = _compute_percentage_count(
-                    reception_attempts, reception_positive_pct
-                )
-                reception_perfect = _compute_percentage_count(
-                    reception_attempts, reception_perfect_pct
-                )
-                attack_attempts = int(attack["attempts"])
-                attack_errors = int(attack["errors"])
-                attack_blocked = int(attack["blocked"])
-                attack_points = int(attack["points"])
-                attack_success_pct = str(attack["success_pct"])
-                block_points = int(block["points"])
-                metrics = MatchStatsMetrics(
-                    serves_attempts=serve_attempts,
-                    serves_errors=serve_errors,
-                    serves_points=serve_points,
-                    receptions_attempts=reception_attempts,
-                    receptions_errors=reception_errors,
-                    receptions_positive_pct=reception_positive_pct,
-                    receptions_perfect_pct=reception_perfect_pct,
-                    attacks_attempts=attack_attempts,
-                    attacks_errors=attack_errors,
-                    attacks_blocked=attack_blocked,
-                    attacks_points=attack_points,
-                    attacks_success_pct=attack_success_pct,
-                    blocks_points=block_points,
-                    receptions_positive=reception_positive,
-                    receptions_perfect=reception_perfect,
-                )
-            except (KeyError, TypeError, ValueError):
-                continue
+            serve = team_entry.serve
+            reception = team_entry.reception
+            attack = team_entry.attack
+            metrics = MatchStatsMetrics(
+                serves_attempts=serve.attempts,
+                serves_errors=serve.errors,
+                serves_points=serve.points,
+                receptions_attempts=reception.attempts,
+                receptions_errors=reception.errors,
+                receptions_positive_pct=reception.positive_pct,
+                receptions_perfect_pct=reception.perfect_pct,
+                attacks_attempts=attack.attempts,
+                attacks_errors=attack.errors,
+                attacks_blocked=attack.blocked,
+                attacks_points=attack.points,
+                attacks_success_pct=attack.success_pct,
+                blocks_points=team_entry.block.points,
+                receptions_positive=_compute_percentage_count(
+                    reception.attempts, reception.positive_pct
+                ),
+                receptions_perfect=_compute_percentage_count(
+                    reception.attempts, reception.perfect_pct
+                ),
+            )
             players: List[MatchPlayerStats] = []
             for player_entry in team_entry.players:
                 metrics_payload = player_entry.metrics or {}
@@ -3145,18 +3174,25 @@ def _parse_percentage_token(token: str) -> str:
     return f"{int(round(value))}%"
 
 
-def _compute_percentage_count(attempts: int, pct: str) -> int:
-    if attempts <= 0:
-        return 0
+@lru_cache(maxsize=1024)
+def _parse_percentage_fraction(pct: str) -> Optional[float]:
     cleaned = pct.strip()
     if not cleaned:
-        return 0
+        return None
     numeric = cleaned.replace("%", "").replace(",", ".")
     try:
-        value = float(numeric)
+        return float(numeric) / 100
     except ValueError:
+        return None
+
+
+def _compute_percentage_count(attempts: int, pct: str) -> int:
+    if attempts <= 0:
         return 0
-    return int(round(attempts * (value / 100)))
+    fraction = _parse_percentage_fraction(pct)
+    if fraction is None:
+        return 0
+    return int(round(attempts * fraction))
 
 
 _STAFF_PREFIXES = (
@@ -3842,13 +3878,26 @@ def fetch_match_stats_totals(
 def collect_match_stats_totals(
     matches: Iterable[Match],
 ) -> Dict[str, Tuple[MatchStatsTotals, ...]]:
+    stats_urls = list(
+        dict.fromkeys(
+            match.stats_url
+            for match in matches
+            if match.is_finished and match.stats_url
+        )
+    )
+    pending = [url for url in stats_urls if url not in _STATS_TOTALS_CACHE]
+    workers = min(STATS_TOTALS_WORKERS, len(pending))
+    if workers > 1:
+        # Parsing the PDFs is CPU-bound, so it is spread over processes; the
+        # results seed this process' cache so later lookups stay in memory.
+        chunksize = max(1, len(pending) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(fetch_match_stats_totals, pending, chunksize=chunksize)
+            for stats_url, summaries in zip(pending, results):
+                _STATS_TOTALS_CACHE[stats_url] = summaries
+
     collected: Dict[str, Tuple[MatchStatsTotals, ...]] = {}
-    for match in matches:
-        if not match.is_finished or not match.stats_url:
-            continue
-        stats_url = match.stats_url
-        if stats_url in collected:
-            continue
+    for stats_url in stats_urls:
         summaries = fetch_match_stats_totals(stats_url)
         if summaries:
             collected[stats_url] = summaries
@@ -6896,6 +6945,7 @@ __all__ = [
     "NewsItem",
     "Match",
     "MatchResult",
+    "MatchDetails",
     "RosterMember",
     "MatchStatsTotals",
     "MatchPlayerStats",
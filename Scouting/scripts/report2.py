@@ -20,15 +20,21 @@ from __future__ import annotations
 
 import argparse
 import csv
-import json
+import fnmatch
+import os
 import re
-from dataclasses import dataclass, field
+import sys
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Iterator, List, Mapping, Optional
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 from zoneinfo import ZoneInfo
 
+import orjson
+
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 CSV_DIRECTORY = BASE_DIR / "docs" / "data" / "csv"
@@ -38,6 +44,9 @@ JSON_OUTPUT_PATH = BASE_DIR / "docs" / "data" / "index2_stats_overview.json"
 
 BERLIN_TZ = ZoneInfo("Europe/Berlin")
 
+# Placeholders the exports use for cells without a value.
+NULL_CELLS = frozenset(("-", ".", "na", "n/a"))
+
 
 # -- Name handling --------------------------------------------------------
 
@@ -69,6 +78,8 @@ TEAM_SHORT_NAME_OVERRIDES: Mapping[str, str] = {
 }
 
 PLAYER_SUFFIX_RE = re.compile(r"\s*\([^)]*\)\s*$")
+NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+WHITESPACE_RE = re.compile(r"\s+")
 
 
 def _smart_capitalize(value: str) -> str:
@@ -79,6 +90,10 @@ def _smart_capitalize(value: str) -> str:
     return " ".join(tokens)
 
 
+# The same handful of team and player names is canonicalised for every row of
+# every match, so both helpers are memoised. Their results are interned, so
+# different spellings of one name share a single string in the payload.
+@lru_cache(maxsize=1024)
 def canonicalize_team_name(raw: str) -> str:
     value = (raw or "").strip()
     if not value:
@@ -86,7 +101,7 @@ def canonicalize_team_name(raw: str) -> str:
     lower = value.lower()
     if lower in TEAM_NAME_OVERRIDES:
         return TEAM_NAME_OVERRIDES[lower]
-    return _smart_capitalize(lower)
+    return sys.intern(_smart_capitalize(lower))
 
 
 def short_team_label(name: str) -> str:
@@ -95,45 +110,58 @@ def short_team_label(name: str) -> str:
 
 
 def slugify(value: str) -> str:
-    normalized = re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
-    return normalized or "team"
+    normalized = NON_ALNUM_RE.sub("-", value.lower()).strip("-")
+    return sys.intern(normalized) if normalized else "team"
 
 
+# Player keys are rebuilt from the same names for every match.
+@lru_cache(maxsize=1024)
 def normalize_key(value: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "", value.lower())
+    return sys.intern(NON_ALNUM_RE.sub("", value.lower()))
 
 
 def parse_optional_int(value: Optional[str]) -> Optional[int]:
     if value is None:
         return None
+    # ``int`` already ignores surrounding whitespace, so plain numbers need
+    # neither ``strip`` nor the placeholder check.
+    try:
+        return int(value)
+    except ValueError:
+        pass
     text = value.strip()
-    if not text or text in {"-", ".", "na", "n/a"}:
+    if not text or text in NULL_CELLS:
         return None
     try:
-        return int(text)
+        return int(float(text.replace(",", ".")))
     except ValueError:
-        try:
-            return int(float(text.replace(",", ".")))
-        except ValueError:
-            return None
+        return None
 
 
+@lru_cache(maxsize=1024)
 def canonicalize_player_name(raw: str) -> str:
     value = (raw or "").strip()
     if not value:
         return "Unbekannte Spielerin"
     cleaned = PLAYER_SUFFIX_RE.sub("", value)
-    cleaned = re.sub(r"\s+", " ", cleaned)
-    return _smart_capitalize(cleaned.lower())
+    cleaned = WHITESPACE_RE.sub(" ", cleaned)
+    return sys.intern(_smart_capitalize(cleaned.lower()))
 
 
 # -- Parsing helpers ------------------------------------------------------
 
+# The CSV exports hold a few hundred distinct cell values across thousands of
+# metric cells, so the cell parsers are memoised per value.
+@lru_cache(maxsize=1024)
 def parse_int(value: Optional[str]) -> int:
-    if value is None:
+    if not value:
         return 0
+    try:
+        return int(value)
+    except ValueError:
+        pass
     text = value.strip()
-    if not text or text in {"-", ".", "na", "n/a"}:
+    if not text or text in NULL_CELLS:
         return 0
     try:
         return int(float(text.replace(",", ".")))
@@ -141,6 +169,7 @@ def parse_int(value: Optional[str]) -> int:
         return 0
 
 
+@lru_cache(maxsize=1024)
 def parse_percentage(value: Optional[str]) -> Optional[float]:
     if value is None:
         return None
@@ -168,16 +197,40 @@ def format_percentage(numerator: int, denominator: int) -> Optional[str]:
     return f"{round(ratio * 100):d}%"
 
 
-def resolve_field(row: Mapping[str, str], *candidates: str) -> str:
+# -- Positional CSV access -----------------------------------------------
+#
+# The CSV files are read with ``csv.reader``; column positions are resolved
+# once per file instead of building a dict per row.
+
+def build_header_index(header: Sequence[str]) -> Dict[str, int]:
+    """Map column names to positions; later duplicates win, as in ``csv.DictReader``."""
+
+    return {column: position for position, column in enumerate(header)}
+
+
+def resolve_column(header_index: Mapping[str, int], *candidates: str) -> Optional[int]:
     for candidate in candidates:
-        if candidate in row:
-            return row[candidate]
-    return ""
+        position = header_index.get(candidate)
+        if position is not None:
+            return position
+    return None
+
+
+def pick_cells(
+    row: Sequence[str], positions: Sequence[Optional[int]]
+) -> List[Optional[str]]:
+    """Return the cells at ``positions``; absent columns and short rows give ``None``."""
+
+    size = len(row)
+    return [
+        row[position] if position is not None and position < size else None
+        for position in positions
+    ]
 
 
 # -- Metrics accumulation -------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class MetricsAccumulator:
     serves_attempts: int = 0
     serves_errors: int = 0
@@ -232,7 +285,7 @@ class MetricsAccumulator:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerAccumulator:
     name: str
     jersey_number: Optional[int]
@@ -263,7 +316,7 @@ class PlayerAccumulator:
     def to_payload(self) -> Dict[str, object]:
         matches_sorted = sorted(
             self.matches,
-            key=lambda entry: entry.get("kickoff", ""),
+            key=itemgetter("kickoff"),
             reverse=True,
         )
         totals_payload = self.totals.to_payload()
@@ -279,7 +332,7 @@ class PlayerAccumulator:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamAccumulator:
     team: str
     slug: str
@@ -332,7 +385,7 @@ class TeamAccumulator:
     def to_payload(self) -> Dict[str, object]:
         matches_sorted = sorted(
             self.matches,
-            key=lambda entry: entry.get("kickoff", ""),
+            key=itemgetter("kickoff"),
             reverse=True,
         )
         totals_payload = self.totals.to_payload()
@@ -363,91 +416,202 @@ class TeamAccumulator:
 
 # -- Data loading ---------------------------------------------------------
 
-def iter_schedule_rows(csv_dir: Path) -> Iterator[Mapping[str, str]]:
-    for path in sorted(csv_dir.glob("*competition*matches*.csv")):
-        if path.stat().st_size == 0:
+CsvEntries = Sequence[Tuple[Path, os.stat_result]]
+
+
+def scan_csv_directory(csv_dir: Path) -> List[Tuple[Path, os.stat_result]]:
+    """Return the CSV files in ``csv_dir`` with their stat results, sorted by name."""
+
+    try:
+        with os.scandir(csv_dir) as iterator:
+            entries = [
+                (Path(entry.path), entry.stat())
+                for entry in iterator
+                if entry.name.endswith(".csv")
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda item: item[0].name)
+    return entries
+
+
+def _matching_entries(
+    csv_dir: Path, pattern: str, entries: Optional[CsvEntries]
+) -> Iterator[Tuple[Path, os.stat_result]]:
+    if entries is None:
+        entries = scan_csv_directory(csv_dir)
+    for path, stat_result in entries:
+        if fnmatch.fnmatch(path.name, pattern):
+            yield path, stat_result
+
+
+SCHEDULE_COLUMNS: Tuple[str, ...] = (
+    "Match ID",
+    "Match Date",
+    "Stadium",
+    "Home Team",
+    "Guest Team",
+    "Home Points",
+    "Guest Points",
+)
+
+
+def iter_schedule_rows(
+    csv_dir: Path, entries: Optional[CsvEntries] = None
+) -> Iterator[List[Optional[str]]]:
+    """Yield the ``SCHEDULE_COLUMNS`` cells of every competition schedule row."""
+
+    for path, stat_result in _matching_entries(csv_dir, "*competition*matches*.csv", entries):
+        if stat_result.st_size == 0:
             continue
         with path.open(newline="", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
+            reader = csv.reader(handle)
+            header = next(reader, None)
+            if not header:
+                continue
+            header_index = build_header_index(header)
+            positions = [header_index.get(column) for column in SCHEDULE_COLUMNS]
             for row in reader:
                 if not row:
                     continue
-                yield row
+                yield pick_cells(row, positions)
 
 
-def load_competition_schedule(csv_dir: Path) -> Dict[str, Dict[str, object]]:
+def load_competition_schedule(
+    csv_dir: Path, entries: Optional[CsvEntries] = None
+) -> Dict[str, Dict[str, object]]:
     schedule: Dict[str, Dict[str, object]] = {}
-    for row in iter_schedule_rows(csv_dir):
-        match_id = (row.get("Match ID") or "").strip()
+    for (
+        match_id_raw,
+        match_date,
+        stadium,
+        home_team_raw,
+        guest_team_raw,
+        home_points,
+        guest_points,
+    ) in iter_schedule_rows(csv_dir, entries):
+        match_id = (match_id_raw or "").strip()
         if not match_id:
             continue
-        home_team_raw = row.get("Home Team") or ""
-        guest_team_raw = row.get("Guest Team") or ""
+        home_team_raw = home_team_raw or ""
+        guest_team_raw = guest_team_raw or ""
         entry = schedule.setdefault(match_id, {})
         entry.update(
             {
                 "match_id": match_id,
-                "match_date": (row.get("Match Date") or "").strip(),
-                "stadium": (row.get("Stadium") or "").strip(),
+                "match_date": (match_date or "").strip(),
+                "stadium": (stadium or "").strip(),
                 "home_team_raw": home_team_raw,
                 "guest_team_raw": guest_team_raw,
                 "home_team": canonicalize_team_name(home_team_raw),
                 "guest_team": canonicalize_team_name(guest_team_raw),
-                "home_points": parse_int(row.get("Home Points")),
-                "guest_points": parse_int(row.get("Guest Points")),
+                "home_points": parse_int(home_points),
+                "guest_points": parse_int(guest_points),
             }
         )
     return schedule
 
 
-def parse_metrics_row(row: Mapping[str, str]) -> Dict[str, int | str | None]:
-    serves_attempts = parse_int(resolve_field(row, "Total Serve", "Total Serves"))
-    receptions_attempts = parse_int(resolve_field(row, "Total Receptions"))
-    attacks_attempts = parse_int(resolve_field(row, "Total Attacks"))
-
-    positive_pct = parse_percentage(
-        resolve_field(
-            row,
-            "Positive Pass Percentage",
-            "Positive Pass Percentage (Pos%)",
-        )
-    )
-    perfect_pct = parse_percentage(
-        resolve_field(
-            row,
-            "Excellent/ Perfect Pass Percentage",
-            "Excellent/ Perfect Pass Percentage (Exc.%)",
-        )
+# Header candidates of the per-match metric columns, in the order
+# ``parse_metrics_row`` unpacks them.
+METRIC_COLUMN_CANDIDATES: Tuple[Tuple[str, ...], ...] = (
+    ("Total Serve", "Total Serves"),
+    ("Serve Errors",),
+    ("Ace", "Aces"),
+    ("Total Receptions",),
+    ("Reception Erros", "Reception Errors"),
+    ("Positive Pass Percentage", "Positive Pass Percentage (Pos%)"),
+    ("Excellent/ Perfect Pass Percentage", "Excellent/ Perfect Pass Percentage (Exc.%)"),
+    ("Total Attacks",),
+    ("Attack Erros", "Attack Errors"),
+    ("Blocked Attack", "Blocked Attacks"),
+    ("Attack Points (Exc.)", "Attack Points"),
+    ("Block Points",),
+    ("Total Points",),
+    ("Break Points",),
+    ("W-L",),
+)
+
+
+def resolve_metric_columns(header_index: Mapping[str, int]) -> Tuple[Optional[int], ...]:
+    return tuple(
+        resolve_column(header_index, *candidates) for candidates in METRIC_COLUMN_CANDIDATES
     )
 
+
+def parse_metrics_row(
+    row: Sequence[str], columns: Sequence[Optional[int]]
+) -> Dict[str, int | str | None]:
+    (
+        serves_attempts_raw,
+        serves_errors_raw,
+        serves_points_raw,
+        receptions_attempts_raw,
+        receptions_errors_raw,
+        positive_pct_raw,
+        perfect_pct_raw,
+        attacks_attempts_raw,
+        attacks_errors_raw,
+        attacks_blocked_raw,
+        attacks_points_raw,
+        blocks_points_raw,
+        total_points_raw,
+        break_points_raw,
+        plus_minus_raw,
+    ) = pick_cells(row, columns)
+
+    serves_attempts = parse_int(serves_attempts_raw)
+    receptions_attempts = parse_int(receptions_attempts_raw)
+    attacks_attempts = parse_int(attacks_attempts_raw)
+
+    positive_pct = parse_percentage(positive_pct_raw)
+    perfect_pct = parse_percentage(perfect_pct_raw)
+
     receptions_positive = compute_count_from_percentage(positive_pct, receptions_attempts)
     receptions_perfect = compute_count_from_percentage(perfect_pct, receptions_attempts)
 
-    attacks_points = parse_int(resolve_field(row, "Attack Points (Exc.)", "Attack Points"))
+    attacks_points = parse_int(attacks_points_raw)
 
     metrics: Dict[str, int | str | None] = {
         "serves_attempts": serves_attempts,
-        "serves_errors": parse_int(resolve_field(row, "Serve Errors")),
-        "serves_points": parse_int(resolve_field(row, "Ace", "Aces")),
+        "serves_errors": parse_int(serves_errors_raw),
+        "serves_points": parse_int(serves_points_raw),
         "receptions_attempts": receptions_attempts,
-        "receptions_errors": parse_int(resolve_field(row, "Reception Erros", "Reception Errors")),
+        "receptions_errors": parse_int(receptions_errors_raw),
         "receptions_positive": receptions_positive,
         "receptions_perfect": receptions_perfect,
         "receptions_positive_pct": format_percentage(receptions_positive, receptions_attempts),
         "receptions_perfect_pct": format_percentage(receptions_perfect, receptions_attempts),
         "attacks_attempts": attacks_attempts,
-        "attacks_errors": parse_int(resolve_field(row, "Attack Erros", "Attack Errors")),
-        "attacks_blocked": parse_int(resolve_field(row, "Blocked Attack", "Blocked Attacks")),
+        "attacks_errors": parse_int(attacks_errors_raw),
+        "attacks_blocked": parse_int(attacks_blocked_raw),
         "attacks_points": attacks_points,
         "attacks_success_pct": format_percentage(attacks_points, attacks_attempts),
-        "blocks_points": parse_int(resolve_field(row, "Block Points")),
-        "total_points": parse_int(resolve_field(row, "Total Points")),
-        "break_points": parse_int(resolve_field(row, "Break Points")),
-        "plus_minus": parse_int(resolve_field(row, "W-L")),
+        "blocks_points": parse_int(blocks_points_raw),
+        "total_points": parse_int(total_points_raw),
+        "break_points": parse_int(break_points_raw),
+        "plus_minus": parse_int(plus_minus_raw),
     }
     return metrics
 
 
+# Every player row of a match shares its date, so the kickoff is parsed once per
+# distinct date.
+@lru_cache(maxsize=512)
+def _kickoff_iso(match_date: str) -> Optional[str]:
+    try:
+        kickoff_dt = datetime.strptime(match_date, "%Y-%m-%d").replace(
+            hour=18,
+            minute=0,
+            tzinfo=BERLIN_TZ,
+        )
+    except ValueError:
+        return None
+    return kickoff_dt.isoformat()
+
+
 def build_match_entry(
     *,
     metrics: Mapping[str, int | str | None],
@@ -464,17 +628,7 @@ def build_match_entry(
 ) -> Dict[str, object]:
     opponent_canonical = canonicalize_team_name(opponent_raw)
     opponent_short = short_team_label(opponent_canonical)
-    kickoff_iso = None
-    if match_date:
-        try:
-            kickoff_dt = datetime.strptime(match_date, "%Y-%m-%d").replace(
-                hour=18,
-                minute=0,
-                tzinfo=BERLIN_TZ,
-            )
-            kickoff_iso = kickoff_dt.isoformat()
-        except ValueError:
-            kickoff_iso = None
+    kickoff_iso = _kickoff_iso(match_date) if match_date else None
 
     result_summary = None
     if schedule_entry:
@@ -531,50 +685,67 @@ def build_match_entry(
     return match_entry
 
 
-def collect_team_accumulators(csv_dir: Path, schedule: Mapping[str, Mapping[str, object]]) -> Dict[str, TeamAccumulator]:
+def collect_team_accumulators(
+    csv_dir: Path,
+    schedule: Mapping[str, Mapping[str, object]],
+    entries: Optional[CsvEntries] = None,
+) -> Dict[str, TeamAccumulator]:
     teams: Dict[str, TeamAccumulator] = {}
-    for path in sorted(csv_dir.glob("vbl-*.csv")):
+    for path, stat_result in _matching_entries(csv_dir, "vbl-*.csv", entries):
         if "competition" in path.name:
             continue
-        if path.stat().st_size == 0:
+        if stat_result.st_size == 0:
             continue
 
         with path.open(newline="", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
+            reader = csv.reader(handle)
+            header_index = build_header_index(next(reader, None) or ())
             team_field = None
-            if reader.fieldnames:
-                if "Home Team" in reader.fieldnames:
-                    team_field = "Home Team"
-                elif "Guest Team" in reader.fieldnames:
-                    team_field = "Guest Team"
-
-            rows: List[Mapping[str, str]] = [row for row in reader if row]
-
-        totals_row: Optional[Mapping[str, str]] = None
-        player_rows: List[Mapping[str, str]] = []
-        for row in rows:
-            name_raw = (row.get("Name") or "").strip()
-            if not name_raw:
-                continue
-            if name_raw.lower() == "totals":
-                totals_row = row
-            else:
-                player_rows.append(row)
+            if "Home Team" in header_index:
+                team_field = "Home Team"
+            elif "Guest Team" in header_index:
+                team_field = "Guest Team"
+            name_position = header_index.get("Name")
+
+            # Sort rows into totals/player rows while reading instead of
+            # materialising the whole file first.
+            totals_row: Optional[List[str]] = None
+            player_rows: List[Tuple[str, List[str]]] = []
+            for row in reader:
+                if not row:
+                    continue
+                (name_cell,) = pick_cells(row, (name_position,))
+                name_raw = (name_cell or "").strip()
+                if not name_raw:
+                    continue
+                if name_raw.lower() == "totals":
+                    totals_row = row
+                else:
+                    player_rows.append((name_raw, row))
 
         if not totals_row:
             continue
 
-        match_id = (totals_row.get("Match ID") or "").strip()
+        match_id_raw, match_date, stadium_raw, team_name_raw = pick_cells(
+            totals_row,
+            [
+                header_index.get("Match ID"),
+                header_index.get("Match Date"),
+                header_index.get("Stadium"),
+                header_index.get(team_field) if team_field else None,
+            ],
+        )
+        match_id = (match_id_raw or "").strip()
         if not match_id:
             continue
 
-        match_date = (totals_row.get("Match Date") or "").strip()
-        stadium_raw = (totals_row.get("Stadium") or "").strip()
+        match_date = (match_date or "").strip()
+        stadium_raw = (stadium_raw or "").strip()
 
         if team_field is None:
             continue
 
-        team_name_raw = totals_row.get(team_field) or ""
+        team_name_raw = team_name_raw or ""
         team_canonical = canonicalize_team_name(team_name_raw)
         team_key = normalize_key(team_canonical)
         opponent_raw = ""
@@ -587,7 +758,9 @@ def collect_team_accumulators(csv_dir: Path, schedule: Mapping[str, Mapping[str,
                 else schedule_entry["home_team_raw"]
             )
 
-        metrics = parse_metrics_row(totals_row)
+        metric_columns = resolve_metric_columns(header_index)
+        number_position = header_index.get("Number")
+        metrics = parse_metrics_row(totals_row, metric_columns)
         match_entry = build_match_entry(
             metrics=metrics,
             schedule_entry=schedule_entry,
@@ -611,13 +784,11 @@ def collect_team_accumulators(csv_dir: Path, schedule: Mapping[str, Mapping[str,
             plus_minus=metrics["plus_minus"],
         )
 
-        for player_row in player_rows:
-            player_name_raw = (player_row.get("Name") or "").strip()
-            if not player_name_raw:
-                continue
+        for player_name_raw, player_row in player_rows:
             player_name = canonicalize_player_name(player_name_raw)
-            jersey_number = parse_optional_int(player_row.get("Number"))
-            player_metrics = parse_metrics_row(player_row)
+            (number_cell,) = pick_cells(player_row, (number_position,))
+            jersey_number = parse_optional_int(number_cell)
+            player_metrics = parse_metrics_row(player_row, metric_columns)
             player_entry = build_match_entry(
                 metrics=player_metrics,
                 schedule_entry=schedule_entry,
@@ -647,9 +818,13 @@ def collect_team_accumulators(csv_dir: Path, schedule: Mapping[str, Mapping[str,
     return teams
 
 
-def build_overview_payload(csv_dir: Path) -> Dict[str, object]:
-    schedule = load_competition_schedule(csv_dir)
-    teams = collect_team_accumulators(csv_dir, schedule)
+def build_overview_payload(
+    csv_dir: Path, entries: Optional[CsvEntries] = None
+) -> Dict[str, object]:
+    if entries is None:
+        entries = scan_csv_directory(csv_dir)
+    schedule = load_competition_schedule(csv_dir, entries)
+    teams = collect_team_accumulators(csv_dir, schedule, entries)
     generated_at = datetime.now(tz=BERLIN_TZ)
 
     league_totals: Optional[Dict[str, object]] = None
@@ -661,7 +836,7 @@ def build_overview_payload(csv_dir: Path) -> Dict[str, object]:
         match_count = 0
 
         for team in teams.values():
-            totals_accumulator.add(vars(team.totals))
+            totals_accumulator.add(asdict(team.totals))
             total_points += team.total_points
             break_points += team.break_points
             plus_minus += team.plus_minus
@@ -1483,6 +1658,10 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 </html>
 """
 
+# The template has a single placeholder, so split it once instead of scanning
+# the whole document on every render.
+_HTML_TEMPLATE_HEAD, _HTML_TEMPLATE_TAIL = HTML_TEMPLATE.split("__JSON_PATH__")
+
 
 # -- CLI ------------------------------------------------------------------
 
@@ -1518,7 +1697,7 @@ def render_html(*, json_path: Path) -> str:
     except ValueError:
         relative_path = json_path
     json_href = str(relative_path).replace('\\', '/')
-    return HTML_TEMPLATE.replace("__JSON_PATH__", json_href)
+    return f"{_HTML_TEMPLATE_HEAD}{json_href}{_HTML_TEMPLATE_TAIL}"
 
 
 def main() -> int:
@@ -1532,8 +1711,8 @@ def main() -> int:
     payload = build_overview_payload(csv_dir)
 
     json_output.parent.mkdir(parents=True, exist_ok=True)
-    json_output.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+    json_output.write_bytes(
+        orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
     )
 
     html_output.parent.mkdir(parents=True, exist_ok=True)
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import csv
+import functools
 import json
 from collections import Counter
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 import re
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
 
 import requests
 
@@ -65,6 +66,17 @@ WIESBADEN_OUTPUT_PATH = Path("docs/data/wiesbaden_stats_overview.json")
 ERFURT_CANONICAL_NAME = "Schwarz-Weiß Erfurt"
 ERFURT_OUTPUT_PATH = Path("docs/data/erfurt_stats_overview.json")
 
+# Teams that get their own overview next to USC:
+# (label, report key, canonical team name, JSON output)
+FOCUS_TEAM_OVERVIEWS = (
+    ("Hamburg", "hamburg", HAMBURG_CANONICAL_NAME, HAMBURG_OUTPUT_PATH),
+    ("Aachen", "aachen", AACHEN_CANONICAL_NAME, AACHEN_OUTPUT_PATH),
+    ("Schwerin", "schwerin", SCHWERIN_CANONICAL_NAME, SCHWERIN_OUTPUT_PATH),
+    ("Dresden", "dresden", DRESDEN_CANONICAL_NAME, DRESDEN_OUTPUT_PATH),
+    ("Wiesbaden", "wiesbaden", WIESBADEN_CANONICAL_NAME, WIESBADEN_OUTPUT_PATH),
+    ("Erfurt", "erfurt", ERFURT_CANONICAL_NAME, ERFURT_OUTPUT_PATH),
+)
+
 LEAGUE_STATS_OUTPUT_PATH = Path("docs/data/league_stats_overview.json")
 
 DEFAULT_ROSTER_DIR = Path("docs/data/rosters")
@@ -182,6 +194,31 @@ def _ensure_path(path: Optional[Path | str]) -> Optional[Path]:
     return Path(path)
 
 
+_GENERATED_FIELD_PATTERN = re.compile(r'"generated": ("[^"]*")')
+
+
+def _write_overview_json(path: Path, payload: Mapping[str, object]) -> bool:
+    serialized = json.dumps(payload, ensure_ascii=False, indent=2)
+    try:
+        existing = path.read_text(encoding="utf-8")
+    except OSError:
+        existing = None
+    if existing is not None:
+        # Only the generation timestamp differs between runs over unchanged
+        # data; keep the existing file in that case instead of rewriting it.
+        old_generated = _GENERATED_FIELD_PATTERN.search(existing)
+        new_generated = _GENERATED_FIELD_PATTERN.search(serialized)
+        if old_generated and new_generated:
+            candidate = serialized.replace(
+                new_generated.group(0), old_generated.group(0)
+            )
+            if candidate == existing:
+                return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(serialized, encoding="utf-8")
+    return True
+
+
 def _load_cached_stats_index() -> Dict[str, str]:
     if not STATS_PDF_INDEX_PATH.exists():
         return {}
@@ -349,6 +386,12 @@ def _select_player_display_name(variants: Sequence[str]) -> str:
     return max(unique_variants, key=_player_name_priority)
 
 
+# Team names repeat across every match, summary and overview build, so the
+# normalisations used by the focus-team checks are cached per process.
+_normalize_team_name = functools.lru_cache(maxsize=None)(normalize_name)
+
+
+@functools.lru_cache(maxsize=None)
 def _resolve_focus_team_label(team_name: str) -> str:
     canonical = TEAM_CANONICAL_LOOKUP.get(normalize_name(team_name))
     if canonical:
@@ -755,6 +798,26 @@ def _prepare_matches_and_lookup(
     return loaded_matches, stats_lookup
 
 
+def prepare_overview_inputs(
+    matches: Optional[Sequence[Match]] = None,
+    *,
+    schedule_csv_url: str = DEFAULT_SCHEDULE_URL,
+    schedule_page_url: str = SCHEDULE_PAGE_URL,
+    schedule_path: Optional[Path] = None,
+    stats_lookup: Optional[Mapping[str, Sequence[MatchStatsTotals]]] = None,
+) -> Tuple[List[Match], Mapping[str, Sequence[MatchStatsTotals]]]:
+    # Resolving the cached PDF fallback matches once up front lets several
+    # overview builds share the result instead of repeating it per team.
+    prepared_matches, prepared_lookup = _prepare_matches_and_lookup(
+        matches,
+        schedule_csv_url=schedule_csv_url or DEFAULT_SCHEDULE_URL,
+        schedule_page_url=schedule_page_url or SCHEDULE_PAGE_URL,
+        schedule_path=_ensure_path(schedule_path),
+        stats_lookup=stats_lookup,
+    )
+    return list(prepared_matches), prepared_lookup
+
+
 def _normalize_roster_member_name(member: RosterMember) -> str:
     return normalize_name(pretty_name(member.name))
 
@@ -1015,8 +1078,7 @@ def build_stats_overview(
 
     if output_path is None:
         output_path = DEFAULT_OUTPUT_PATH
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    _write_overview_json(output_path, payload)
 
     return payload
 
@@ -1099,23 +1161,23 @@ def build_league_stats_overview(
 
     if output_path is None:
         output_path = LEAGUE_STATS_OUTPUT_PATH
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    _write_overview_json(output_path, payload)
 
     return payload
 
 
+@functools.lru_cache(maxsize=None)
 def _build_focus_aliases(
     focus_team: str, focus_label: str, focus_normalized: str
-) -> Set[str]:
+) -> FrozenSet[str]:
     aliases: Set[str] = set()
     if focus_team:
-        aliases.add(normalize_name(focus_team))
+        aliases.add(_normalize_team_name(focus_team))
     aliases.add(focus_normalized)
     for alias_normalized, canonical in TEAM_CANONICAL_LOOKUP.items():
-        if normalize_name(canonical) == focus_normalized:
+        if _normalize_team_name(canonical) == focus_normalized:
             aliases.add(alias_normalized)
-    return {alias for alias in aliases if alias}
+    return frozenset(alias for alias in aliases if alias)
 
 
 def _matches_focus_team(
@@ -1123,13 +1185,13 @@ def _matches_focus_team(
     *,
     focus_label: str,
     focus_normalized: str,
-    focus_aliases: Set[str],
+    focus_aliases: FrozenSet[str],
 ) -> bool:
-    normalized = normalize_name(name)
+    normalized = _normalize_team_name(name)
     if normalized in focus_aliases:
         return True
     canonical = TEAM_CANONICAL_LOOKUP.get(normalized)
-    if canonical and normalize_name(canonical) == focus_normalized:
+    if canonical and _normalize_team_name(canonical) == focus_normalized:
         return True
     for alias in focus_aliases:
         if alias in normalized:
@@ -1153,6 +1215,7 @@ __all__ = [
     "WIESBADEN_OUTPUT_PATH",
     "ERFURT_CANONICAL_NAME",
     "ERFURT_OUTPUT_PATH",
+    "FOCUS_TEAM_OVERVIEWS",
     "LEAGUE_STATS_OUTPUT_PATH",
     "SCHWERIN_CANONICAL_NAME",
     "SCHWERIN_OUTPUT_PATH",
@@ -1164,5 +1227,6 @@ __all__ = [
     "collect_team_player_stats",
     "collect_usc_match_stats",
     "collect_usc_player_stats",
+    "prepare_overview_inputs",
     "summarize_metrics",
 ]
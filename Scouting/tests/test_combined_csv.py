@@ -9,7 +9,8 @@ PACKAGE_ROOT = PROJECT_ROOT / "Scouting"
 if str(PACKAGE_ROOT) not in sys.path:
     sys.path.insert(0, str(PACKAGE_ROOT))
 
-from scripts.combined_csv import export_combined_player_stats
+from scripts.combined_csv import _build_match_lookup, _lookup_match, export_combined_player_stats
+from scripts.report2 import scan_csv_directory
 
 
 def test_export_combined_player_stats_merges_sources(tmp_path):
@@ -212,6 +213,18 @@ def test_export_combined_player_stats_merges_sources(tmp_path):
     assert row["host"] == "Test Team"
     assert float(row["receptions_positive_pct"]) == 0.5
 
+    prescanned_output = tmp_path / "combined-prescanned.csv"
+    export_combined_player_stats(
+        league_payload=league_payload,
+        csv_payload=csv_payload,
+        csv_data_dir=csv_dir,
+        output_path=prescanned_output,
+        csv_entries=scan_csv_directory(csv_dir),
+    )
+    assert prescanned_output.read_text(encoding="utf-8") == output_path.read_text(
+        encoding="utf-8"
+    )
+
 
 def test_export_combined_player_stats_marks_matching_sources(tmp_path):
     csv_dir = tmp_path / "csv"
@@ -710,3 +723,14 @@ def test_export_combined_player_stats_writes_empty_diff_csv_when_values_match(tm
         diff_rows = list(diff_reader)
 
     assert diff_rows == []
+
+
+def test_match_lookup_keeps_match_ids_and_numbers_apart():
+    by_number = {"match_number": "2007", "host": "USC Münster"}
+    by_id = {"match_id": "2007", "host": "Dresdner SC"}
+    lookup = _build_match_lookup([by_number, by_id])
+
+    assert _lookup_match(lookup, None, "2007") is by_number
+    assert _lookup_match(lookup, "2007", None) is by_id
+    assert _lookup_match(lookup, "other", "2007") is by_number
+    assert _lookup_match(lookup, "other", None) == {}
@@ -8,7 +8,7 @@ PACKAGE_ROOT = PROJECT_ROOT / "Scouting"
 if str(PACKAGE_ROOT) not in sys.path:
     sys.path.insert(0, str(PACKAGE_ROOT))
 
-from scripts.combined_player_report import render_combined_player_html
+from scripts.combined_player_report import render_combined_player_html, render_table_rows
 
 
 def _write_sample_csv(path: Path) -> None:
@@ -32,3 +32,33 @@ def test_render_combined_player_html(tmp_path: Path) -> None:
     assert "PDF, CSV: USC Münster" in html
     assert "60.0%" in html  # formatted percentage from attacks_success_pct
     assert "href=\"https://example.com/stats.pdf\"" in html
+
+
+def test_render_table_rows_escapes_each_cell() -> None:
+    rows = [
+        {"player_name": "O'Neil <b>", "team": "A & B", "stats_url": "https://x.test/?a=1&b=\"2\""},
+        {"player_name": "split\x1fname", "team": "C"},
+    ]
+
+    html = render_table_rows(rows)
+    first, second = html.split("\n")
+
+    assert "<td>O&#x27;Neil &lt;b&gt;</td>" in first
+    assert "<td>A &amp; B</td>" in first
+    assert 'href="https://x.test/?a=1&amp;b=&quot;2&quot;"' in first
+    assert "<td>split\x1fname</td>" in second
+    assert first.count("<td>") == second.count("<td>")
+
+
+def test_render_table_rows_escapes_unexpected_text_in_numeric_columns() -> None:
+    rows = [
+        {"total_points": "12", "attacks_success_pct": "0.5"},
+        {"total_points": "<12>", "attacks_success_pct": "n/a & more"},
+    ]
+
+    first, second = render_table_rows(rows).split("\n")
+
+    assert "<td>12</td>" in first
+    assert "<td>50.0%</td>" in first
+    assert "<td>&lt;12&gt;</td>" in second
+    assert "<td>n/a &amp; more</td>" in second
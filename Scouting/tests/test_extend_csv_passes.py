@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from scripts.extend_csv_passes import compute_pass_value, extend_csv
+
+
+def test_extend_csv_inserts_derived_pass_columns(tmp_path) -> None:
+    input_path = tmp_path / "match.csv"
+    input_path.write_text(
+        "Name,Total Receptions,Positive Pass Percentage,Excellent/ Perfect Pass Percentage,Ace\n"
+        "Spielerin A,7,50%,\"14,3%\",1\n"
+        "Spielerin B,-,-,-,0\n",
+        encoding="utf-8",
+    )
+    output_path = tmp_path / "out" / "match.csv"
+
+    extend_csv(input_path, output_path)
+
+    assert output_path.read_text(encoding="utf-8").splitlines() == [
+        "Name,Total Receptions,Positive Pass,Perfect Pass,Positive Pass Percentage,"
+        "Excellent/ Perfect Pass Percentage,Ace",
+        "Spielerin A,7,4,1,50%,\"14,3%\",1",
+        "Spielerin B,-,-,-,-,-,0",
+    ]
+
+
+def test_extend_csv_copies_files_without_reception_columns(tmp_path) -> None:
+    input_path = tmp_path / "schedule.csv"
+    input_path.write_text("Team,Punkte\nUSC,3\n", encoding="utf-8")
+    empty_path = tmp_path / "empty.csv"
+    empty_path.write_text("", encoding="utf-8")
+
+    extend_csv(input_path, tmp_path / "out" / "schedule.csv")
+    extend_csv(empty_path, tmp_path / "out" / "empty.csv")
+
+    assert (tmp_path / "out" / "schedule.csv").read_text(encoding="utf-8").splitlines() == [
+        "Team,Punkte",
+        "USC,3",
+    ]
+    assert (tmp_path / "out" / "empty.csv").read_text(encoding="utf-8") == ""
+
+
+def test_compute_pass_value_rounds_halves_up() -> None:
+    assert compute_pass_value("3", "50%") == "2"
+    assert compute_pass_value("5", "10") == "1"
+    assert compute_pass_value("", "50%") == "-"
@@ -100,8 +100,8 @@ def test_load_manual_team_files(tmp_path):
     assert team_file.aliases == ("TT",)
     assert len(team_file.matches) == 2
     first_match = team_file.matches[0]
-    assert first_match.serve["attempts"] == 10
-    assert first_match.reception["positive_pct"] == "40%"
+    assert first_match.serve.attempts == 10
+    assert first_match.reception.positive_pct == "40%"
     assert first_match.aliases == team_file.aliases
 
 
@@ -152,3 +152,16 @@ def test_find_manual_team_file_handles_diacritics(tmp_path):
     entry = find_manual_team_file("uber vc munster", directory=directory)
     assert entry is not None
     assert entry.team == "Über VC Münster"
+
+
+def test_load_manual_team_files_picks_up_changed_files(tmp_path):
+    directory = _create_manual_stats_file(tmp_path)
+    path = directory / "test_team.json"
+
+    assert load_manual_team_files(directory)[0].team == "Test Team"
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload["team"] = "Renamed Team"
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    assert load_manual_team_files(directory)[0].team == "Renamed Team"
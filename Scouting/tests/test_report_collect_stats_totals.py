@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from scripts import report
+
+
+def _make_match(match_number: str, stats_url: str | None) -> report.Match:
+    return report.Match(
+        kickoff=datetime(2025, 10, 12, 16, 0, tzinfo=report.BERLIN_TZ),
+        home_team="USC Münster",
+        away_team="SSC Palmberg Schwerin",
+        host="USC Münster",
+        location="Münster",
+        result=report.MatchResult(score="3:1", total_points=None, sets=()),
+        match_number=match_number,
+        stats_url=stats_url,
+    )
+
+
+def test_collect_match_stats_totals_seeds_cache_from_workers(monkeypatch) -> None:
+    cache: dict[str, tuple] = {"cached.pdf": ("cached",)}
+    worker_calls: list[str] = []
+
+    def fake_fetch_match_stats_totals(stats_url: str):
+        if stats_url not in cache:
+            worker_calls.append(stats_url)
+            cache[stats_url] = () if stats_url == "empty.pdf" else (stats_url,)
+        return cache[stats_url]
+
+    monkeypatch.setattr(report, "_STATS_TOTALS_CACHE", cache)
+    monkeypatch.setattr(report, "fetch_match_stats_totals", fake_fetch_match_stats_totals)
+    monkeypatch.setattr(report, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(report, "STATS_TOTALS_WORKERS", 4)
+
+    matches = [
+        _make_match("1", "b.pdf"),
+        _make_match("2", "cached.pdf"),
+        _make_match("3", "a.pdf"),
+        _make_match("4", "b.pdf"),
+        _make_match("5", "empty.pdf"),
+        _make_match("6", None),
+    ]
+
+    collected = report.collect_match_stats_totals(matches)
+
+    assert sorted(worker_calls) == ["a.pdf", "b.pdf", "empty.pdf"]
+    assert list(collected) == ["b.pdf", "cached.pdf", "a.pdf"]
+    assert collected["a.pdf"] == ("a.pdf",)
@@ -0,0 +1,48 @@
+from datetime import datetime
+
+import requests
+
+from scripts import report
+
+
+def _make_match(match_number: str, match_id: str | None = None) -> report.Match:
+    return report.Match(
+        kickoff=datetime(2025, 10, 12, 16, 0, tzinfo=report.BERLIN_TZ),
+        home_team="USC Münster",
+        away_team="SSC Palmberg Schwerin",
+        host="USC Münster",
+        location="Münster",
+        result=None,
+        match_number=match_number,
+        match_id=match_id,
+    )
+
+
+def test_enrich_matches_fetches_each_detail_page_once(monkeypatch) -> None:
+    calls: list[str] = []
+
+    def fake_fetch_match_details(match_id: str):
+        calls.append(match_id)
+        if match_id == "broken":
+            raise requests.RequestException("offline")
+        return report.MatchDetails(referees=(f"Ref {match_id}",), attendance="100")
+
+    monkeypatch.setattr(report, "fetch_match_details", fake_fetch_match_details)
+
+    metadata = {"1": {"match_id": "a"}, "2": {"match_id": "b"}}
+    matches = [
+        _make_match("1"),
+        _make_match("2"),
+        _make_match("3", match_id="a"),
+        _make_match("4", match_id="broken"),
+    ]
+    detail_cache: dict[str, report.MatchDetails] = {}
+
+    enriched = report.enrich_matches(matches, metadata, detail_cache)
+
+    assert sorted(calls) == ["a", "b", "broken"]
+    assert [match.match_id for match in enriched] == ["a", "b", "a", "broken"]
+    assert enriched[0].referees == ("Ref a",)
+    assert enriched[1].attendance == "100"
+    assert enriched[3].referees == ()
+    assert detail_cache["broken"] == report.MatchDetails()
@@ -28,3 +28,17 @@ def test_build_parser_accepts_combined_csv_output(tmp_path):
     target = tmp_path / "players.csv"
     args = parser.parse_args(["--combined-player-csv-output", str(target)])
     assert args.combined_player_csv_output == target
+
+
+def test_build_parser_is_reused_between_parses():
+    parser = __main__.build_parser()
+    assert __main__.build_parser() is parser
+    assert parser.parse_args(["--skip-html"]).skip_html is True
+    assert parser.parse_args([]).skip_html is False
+
+
+def test_manifest_is_only_rewritten_when_changed(tmp_path):
+    manifest_path = tmp_path / "manifest.webmanifest"
+    assert __main__._write_bytes_if_changed(manifest_path, __main__._MANIFEST_BYTES)
+    assert manifest_path.read_bytes() == __main__._MANIFEST_BYTES
+    assert not __main__._write_bytes_if_changed(manifest_path, __main__._MANIFEST_BYTES)
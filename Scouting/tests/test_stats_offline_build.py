@@ -113,6 +113,45 @@ def test_build_stats_overview_for_other_team(monkeypatch, tmp_path) -> None:
     assert match["metrics"]["attacks_points"] == 50
 
 
+def test_prepared_overview_inputs_match_standalone_build(monkeypatch, tmp_path) -> None:
+    def offline_http_get(*args, **kwargs):
+        raise requests.RequestException("offline")
+
+    monkeypatch.setattr(report, "_http_get", offline_http_get)
+
+    matches, stats_lookup = stats_module.prepare_overview_inputs()
+    shared = stats_module.build_stats_overview(
+        matches=matches,
+        stats_lookup=stats_lookup,
+        output_path=tmp_path / "shared.json",
+        focus_team="SSC Palmberg Schwerin",
+    )
+    standalone = stats_module.build_stats_overview(
+        output_path=tmp_path / "standalone.json",
+        focus_team="SSC Palmberg Schwerin",
+    )
+
+    assert shared["match_count"] == standalone["match_count"]
+    assert shared["matches"] == standalone["matches"]
+    assert shared["players"] == standalone["players"]
+
+
+def test_build_stats_overview_keeps_unchanged_output(monkeypatch, tmp_path) -> None:
+    def offline_http_get(*args, **kwargs):
+        raise requests.RequestException("offline")
+
+    monkeypatch.setattr(report, "_http_get", offline_http_get)
+
+    output_path = tmp_path / "usc.json"
+    first = stats_module.build_stats_overview(output_path=output_path)
+    written = output_path.read_text(encoding="utf-8")
+
+    second = stats_module.build_stats_overview(output_path=output_path)
+
+    assert second["generated"] != first["generated"]
+    assert output_path.read_text(encoding="utf-8") == written
+
+
 def test_build_stats_overview_for_hamburg_includes_players(monkeypatch, tmp_path) -> None:
     def offline_http_get(*args, **kwargs):
         raise requests.RequestException("offline")